@@ -0,0 +1,156 @@
+import re
+import time
+from typing import Optional, List, Tuple, Sequence, Union, Dict
+
+# ========================
+# AUTO-RESPONSE TRIGGERS
+# ========================
+
+# (trigger keywords, reply or list of replies) - earlier groups win
+AUTO_RESPONSES: List[Tuple[Tuple[str, ...], Union[str, List[str]]]] = [
+    (("hello", "hi", "salam", "wa fen", "ahlan", "salam w 3lykom"), ["salam w 3lykom", "Ach endek alkhawa"]),
+    (("arawkan", "ajihna"), [
+        "Théoriquement", "plus ou moins", "Next",
+        "Tout ce qu'on a vu", "Pas de question ?",
+        "7yed telephone", "Parfait !", "Madmoiselle",
+        "Pas de goblet sur table", "C'est la pire des solutions !!"
+        "Ehhh, Aji lhna fen ghadi !",
+    ]),
+]
+
+class KeywordMatcher:
+    """
+    Keyword index compiled once, finding the first triggered group in one pass.
+
+    Matching keeps the old ``any(word in content for word in keywords)``
+    semantics: keywords match as plain substrings of the lowercased message,
+    and when several groups match, the one listed first wins regardless of
+    where in the message its keyword appears.
+    """
+
+    def __init__(self, groups: Sequence[Tuple[Sequence[str], Union[str, List[str]]]]):
+        self.groups = list(groups)
+        self._group_of = {}
+        ordered = []
+        for index, (keywords, _) in enumerate(self.groups):
+            for keyword in sorted(keywords, key=len, reverse=True):
+                if keyword not in self._group_of:
+                    self._group_of[keyword] = index
+                    ordered.append(keyword)
+
+        # Cheap pre-filter bound: shortest trigger
+        self.min_length = min((len(k) for k in ordered), default=0)
+
+        self.scanned = 0
+        self.short_circuited: Dict[str, int] = dict.fromkeys(("bot", "empty", "too_short"), 0)
+
+        # Alternatives are listed by group, so a search at any position reports
+        # the best group starting there; a plain alternation (no lookahead)
+        # keeps the regex engine's first-character prefix scan.
+        self._pattern = re.compile("|".join(re.escape(k) for k in ordered))
+
+    def should_scan(self, content: str, from_bot: bool = False) -> bool:
+        """
+        Fast pre-filter on the raw message: False when it cannot trigger anything.
+
+        Only O(1) checks: bot messages and empty or too-short content are
+        skipped before any lowercasing or scan.
+        """
+        if from_bot:
+            reason = "bot"
+        elif not content:
+            reason = "empty"
+        elif len(content) < self.min_length:
+            reason = "too_short"
+        else:
+            self.scanned += 1
+            return True
+
+        self.short_circuited[reason] += 1
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        skipped = sum(self.short_circuited.values())
+        return {
+            'seen': self.scanned + skipped,
+            'scanned': self.scanned,
+            'short_circuited': skipped,
+            **{f"skipped_{reason}": count for reason, count in self.short_circuited.items()},
+        }
+
+    def match(self, content: str) -> Optional[int]:
+        """Return the index of the first matching group for lowercased content"""
+        best = None
+        search = self._pattern.search
+        found = search(content)
+        while found is not None:
+            index = self._group_of[found.group()]
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+            # Resume one character later, not at the match end, so overlapping
+            # triggers ("hi" inside "ajihna") are seen exactly like with `in`
+            found = search(content, found.start() + 1)
+        return best
+
+    def response_for(self, content: str) -> Optional[Union[str, List[str]]]:
+        """Return the reply (or list of replies) triggered by lowercased content"""
+        index = self.match(content)
+        return self.groups[index][1] if index is not None else None
+
+# ========================
+# AUTO-RESPONSE RATE LIMIT
+# ========================
+
+class AutoResponseLimiter:
+    """
+    Per-channel token bucket in front of auto-response sends.
+
+    Each channel gets ``capacity`` replies refilled over ``per`` seconds. With
+    the default capacity of 1, every trigger arriving inside one window
+    collapses into the single reply already sent, leaving the channel's send
+    bucket to command output.
+    """
+
+    def __init__(self, capacity: int = 1, per: float = 10.0):
+        self.default = (capacity, per)
+        self.overrides: Dict[int, Tuple[int, float]] = {}
+        # channel id -> [tokens, last refill time]
+        self._buckets: Dict[int, List[float]] = {}
+
+        self.allowed = 0
+        self.suppressed = 0
+
+    def configure(self, channel_id: int, capacity: int, per: float):
+        """Override the limit for one channel (capacity 0 mutes auto-responses)"""
+        self.overrides[channel_id] = (capacity, per)
+        self._buckets.pop(channel_id, None)
+
+    def reset(self, channel_id: int):
+        """Return a channel to the default limit"""
+        self.overrides.pop(channel_id, None)
+        self._buckets.pop(channel_id, None)
+
+    def limit_for(self, channel_id: int) -> Tuple[int, float]:
+        return self.overrides.get(channel_id, self.default)
+
+    def try_acquire(self, channel_id: int) -> bool:
+        """Take one token for the channel; False means drop this reply"""
+        capacity, per = self.limit_for(channel_id)
+        now = time.monotonic()
+
+        bucket = self._buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._buckets[channel_id] = [float(capacity), now]
+        elif capacity > 0:
+            bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * capacity / per)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            self.allowed += 1
+            return True
+
+        self.suppressed += 1
+        return False
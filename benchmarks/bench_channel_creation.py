@@ -0,0 +1,140 @@
+"""
+Wall-clock time to create N categories (each with the five default channels)
+against a local fake Discord API, serial creates vs ``ChannelCreationScheduler``.
+
+The fake API answers ``POST /guilds/{id}/channels`` after a fixed latency and
+enforces a per-route bucket, sending the same X-RateLimit-* headers (and 429s)
+as Discord. Requests go through discord.py's real ``HTTPClient``, so its bucket
+handling is what paces the concurrent run.
+
+Usage: python benchmarks/bench_channel_creation.py [categories] [latency_ms] [bucket_limit] [bucket_window_s]
+"""
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+
+import discord
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from bulk_ops import ChannelCreationScheduler
+
+TEXT_CHANNELS = ["cours", "tds", "tps", "exams", "bonus"]
+GUILD_ID = 1234
+
+def json_response(data, status=200, headers=None):
+    # discord.py only decodes bodies whose content type is exactly application/json
+    return web.Response(body=json.dumps(data).encode(), status=status,
+                        headers={**(headers or {}), "Content-Type": "application/json"})
+
+class FakeDiscordAPI:
+    """Minimal Discord REST stub with one fixed-window bucket for channel creates"""
+
+    def __init__(self, latency: float, limit: int, window: float):
+        self.latency = latency
+        self.limit = limit
+        self.window = window
+        self.window_start = 0.0
+        self.used = 0
+        self.created = 0
+        self.rejected = 0
+        self.ids = itertools.count(10_000)
+
+    def _headers(self, now: float):
+        reset_after = max(0.0, self.window_start + self.window - now)
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(0, self.limit - self.used)),
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            "X-RateLimit-Reset": f"{time.time() + reset_after:.3f}",
+            "X-RateLimit-Bucket": "channel-create",
+        }
+
+    async def me(self, request):
+        return json_response({"id": "1", "username": "bench", "discriminator": "0", "avatar": None})
+
+    async def create_channel(self, request):
+        payload = await request.json()
+        now = time.monotonic()
+        if now >= self.window_start + self.window:
+            self.window_start, self.used = now, 0
+
+        if self.used >= self.limit:
+            self.rejected += 1
+            retry_after = self.window_start + self.window - now
+            return json_response(
+                {"message": "You are being rate limited.", "retry_after": retry_after, "global": False},
+                status=429, headers={**self._headers(now), "Retry-After": f"{retry_after:.3f}"},
+            )
+
+        self.used += 1
+        headers = self._headers(now)
+        await asyncio.sleep(self.latency)
+        self.created += 1
+        return json_response({
+            "id": str(next(self.ids)), "type": payload["type"], "name": payload["name"],
+            "position": payload.get("position", 0), "parent_id": payload.get("parent_id"),
+            "guild_id": str(GUILD_ID),
+        }, headers=headers)
+
+async def start_api(api: FakeDiscordAPI) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/api/v10/users/@me", api.me)
+    app.router.add_post("/api/v10/guilds/{guild_id}/channels", api.create_channel)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    discord.http.Route.BASE = f"http://127.0.0.1:{port}/api/v10"
+    return runner
+
+async def create_serial(http, names):
+    for category_name in names:
+        category = await http.create_channel(GUILD_ID, 4, name=category_name)
+        for ch_name in TEXT_CHANNELS:
+            await http.create_channel(GUILD_ID, 0, name=ch_name, parent_id=category["id"])
+
+async def create_scheduled(http, names):
+    scheduler = ChannelCreationScheduler(concurrency=5)
+    for category_name in names:
+        category = await http.create_channel(GUILD_ID, 4, name=category_name)
+        results = await scheduler.run(
+            lambda ch_name, position: http.create_channel(
+                GUILD_ID, 0, name=ch_name, parent_id=category["id"], position=position
+            ),
+            TEXT_CHANNELS,
+        )
+        assert [name for name, _ in results] == TEXT_CHANNELS
+        assert [channel["position"] for _, channel in results] == list(range(len(TEXT_CHANNELS)))
+
+async def run(label, create, categories, latency, limit, window):
+    api = FakeDiscordAPI(latency, limit, window)
+    runner = await start_api(api)
+    http = discord.http.HTTPClient(asyncio.get_running_loop())
+    try:
+        await http.static_login("bench-token")
+        started = time.perf_counter()
+        await create(http, [f"Module {i}" for i in range(categories)])
+        elapsed = time.perf_counter() - started
+    finally:
+        await http.close()
+        await runner.cleanup()
+    print(f"{label:<8} wall: {elapsed:6.2f}s   created: {api.created}   429s: {api.rejected}")
+
+async def main(categories, latency, limit, window):
+    print(f"{categories} categories x {len(TEXT_CHANNELS)} channels, latency {latency * 1000:.0f}ms, "
+          f"bucket {limit} per {window:g}s")
+    await run("before", create_serial, categories, latency, limit, window)
+    await run("after", create_scheduled, categories, latency, limit, window)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    categories = int(args[0]) if len(args) > 0 else 10
+    latency_ms = int(args[1]) if len(args) > 1 else 150
+    limit = int(args[2]) if len(args) > 2 else 50
+    window = float(args[3]) if len(args) > 3 else 5.0
+    asyncio.run(main(categories, latency_ms / 1000, limit, window))
@@ -0,0 +1,167 @@
+"""
+Wall-clock time to delete one category with N channels against a local fake
+Discord API: the old loop (one delete, one progress edit, strictly in turn)
+vs the job-queue executor with bounded workers.
+
+The fake API answers ``DELETE /channels/{id}`` and progress-message edits
+after a fixed latency. Each route sends per-major-parameter X-RateLimit-*
+headers (and 429s): one bucket per deleted channel, and a 5-per-5s bucket for
+message edits in the command channel. Requests go through discord.py's real
+``HTTPClient``, so its bucket handling paces both runs.
+
+Usage: python benchmarks/bench_channel_deletion.py [channels] [latency_ms] [workers]
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+import discord
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from job_queue import JobQueue
+
+GUILD_ID = 1234
+COMMAND_CHANNEL_ID = 42
+PROGRESS_MESSAGE_ID = 4242
+CATEGORY_ID = 100
+
+def json_response(data, status=200, headers=None):
+    # discord.py only decodes bodies whose content type is exactly application/json
+    return web.Response(body=json.dumps(data).encode(), status=status,
+                        headers={**(headers or {}), "Content-Type": "application/json"})
+
+class Bucket:
+    """Fixed-window bucket reporting Discord-style headers"""
+
+    def __init__(self, name: str, limit: int, window: float):
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.window_start = 0.0
+        self.used = 0
+
+    def take(self, now: float):
+        if now >= self.window_start + self.window:
+            self.window_start, self.used = now, 0
+        allowed = self.used < self.limit
+        if allowed:
+            self.used += 1
+        reset_after = max(0.0, self.window_start + self.window - now)
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(0, self.limit - self.used)),
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            "X-RateLimit-Reset": f"{time.time() + reset_after:.3f}",
+            "X-RateLimit-Bucket": self.name,
+        }
+        return allowed, reset_after, headers
+
+class FakeDiscordAPI:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.delete_buckets = {}
+        self.edit_bucket = Bucket("message-edit", 5, 5.0)
+        self.deleted = 0
+        self.edits = 0
+        self.rejected = 0
+
+    async def _limited(self, bucket: Bucket, handler):
+        allowed, reset_after, headers = bucket.take(time.monotonic())
+        if not allowed:
+            self.rejected += 1
+            return json_response(
+                {"message": "You are being rate limited.", "retry_after": reset_after, "global": False},
+                status=429, headers={**headers, "Retry-After": f"{reset_after:.3f}"},
+            )
+        await asyncio.sleep(self.latency)
+        return json_response(handler(), headers=headers)
+
+    async def me(self, request):
+        return json_response({"id": "1", "username": "bench", "discriminator": "0", "avatar": None})
+
+    async def delete_channel(self, request):
+        channel_id = request.match_info["channel_id"]
+        bucket = self.delete_buckets.setdefault(channel_id, Bucket("channel-delete", 5, 5.0))
+
+        def handler():
+            self.deleted += 1
+            return {"id": channel_id, "type": 0, "name": "x", "guild_id": str(GUILD_ID), "position": 0}
+        return await self._limited(bucket, handler)
+
+    async def edit_message(self, request):
+        def handler():
+            self.edits += 1
+            return {"id": str(PROGRESS_MESSAGE_ID), "channel_id": str(COMMAND_CHANNEL_ID), "content": ""}
+        return await self._limited(self.edit_bucket, handler)
+
+async def start_api(api: FakeDiscordAPI) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/api/v10/users/@me", api.me)
+    app.router.add_delete("/api/v10/channels/{channel_id}", api.delete_channel)
+    app.router.add_patch("/api/v10/channels/{channel_id}/messages/{message_id}", api.edit_message)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    discord.http.Route.BASE = f"http://127.0.0.1:{port}/api/v10"
+    return runner
+
+def edit_progress(http, text):
+    with discord.http.handle_message_parameters(content=text) as params:
+        return http.edit_message(COMMAND_CHANNEL_ID, PROGRESS_MESSAGE_ID, params=params)
+
+async def delete_serial(http, channel_ids, workers):
+    """The previous delete_cat_chan loop: progress edit, then delete, per channel"""
+    for i, channel_id in enumerate(channel_ids, 1):
+        await edit_progress(http, f"Deleting channel {i}/{len(channel_ids)}")
+        await http.delete_channel(channel_id)
+    await edit_progress(http, "Deleting category...")
+    await http.delete_channel(CATEGORY_ID)
+
+async def delete_job(http, channel_ids, workers):
+    ops = [{"op": "delete_channel", "channel_id": cid, "name": str(cid), "phase": 0} for cid in channel_ids]
+    ops.append({"op": "delete_channel", "channel_id": CATEGORY_ID, "name": "category", "phase": 1})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = JobQueue(os.path.join(tmp, "jobs.db"))
+        queue.attach(http)
+
+        async def on_done(finished):
+            if finished == len(channel_ids):
+                await edit_progress(http, "Deleting category...")
+
+        job_id = queue.submit("delete_category", GUILD_ID, COMMAND_CHANNEL_ID, "bench", ops, concurrency=workers)
+        errors = await queue.run(job_id, on_done=on_done)
+        queue.close()
+    assert all(error is None for error in errors)
+
+async def run(label, delete, channels, latency, workers):
+    api = FakeDiscordAPI(latency)
+    runner = await start_api(api)
+    http = discord.http.HTTPClient(asyncio.get_running_loop())
+    try:
+        await http.static_login("bench-token")
+        started = time.perf_counter()
+        await delete(http, list(range(1000, 1000 + channels)), workers)
+        elapsed = time.perf_counter() - started
+    finally:
+        await http.close()
+        await runner.cleanup()
+    print(f"{label:<8} wall: {elapsed:6.2f}s   deletes: {api.deleted}   edits: {api.edits}   429s: {api.rejected}")
+
+async def main(channels, latency, workers):
+    print(f"1 category x {channels} channels, latency {latency * 1000:.0f}ms, {workers} workers")
+    await run("before", delete_serial, channels, latency, workers)
+    await run("after", delete_job, channels, latency, workers)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    channels = int(args[0]) if len(args) > 0 else 50
+    latency_ms = int(args[1]) if len(args) > 1 else 150
+    workers = int(args[2]) if len(args) > 2 else 5
+    asyncio.run(main(channels, latency_ms / 1000, workers))
@@ -0,0 +1,80 @@
+"""
+Auto-response matching throughput, per-message dict + substring scans vs
+the precompiled ``KeywordMatcher``.
+
+Builds a corpus of synthetic chat messages (a share of them short replies,
+reactions or empty attachment posts, a share containing a trigger), checks both implementations pick the same group for every message,
+then reports messages/sec for each, with and without the ``should_scan``
+fast path in front of the matcher.
+
+Usage: python benchmarks/bench_keyword_matcher.py [messages] [trigger_ratio] [short_ratio]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from auto_responses import AUTO_RESPONSES, KeywordMatcher
+
+WORDS = [
+    "le", "cours", "demain", "td", "exam", "prof", "salle", "question", "merci", "ok",
+    "wach", "kayn", "chi", "devoir", "projet", "java", "python", "reseau", "systeme", "note",
+    "the", "deadline", "lab", "report", "group", "meeting", "slides", "pdf", "link", "send",
+]
+
+# Typical one-word replies, reactions and attachment-only (empty) messages
+SHORT_MESSAGES = ["", "ok", "mrc", "+1", "?", "lol", "👍", "😂😂", "yep", "top", "<:pepe:1234>", "🔥"]
+
+def make_corpus(count: int, trigger_ratio: float, short_ratio: float = 0.3, seed: int = 42):
+    rng = random.Random(seed)
+    triggers = [kw for keywords, _ in AUTO_RESPONSES for kw in keywords]
+    corpus = []
+    for _ in range(count):
+        if rng.random() < short_ratio:
+            corpus.append(rng.choice(SHORT_MESSAGES))
+            continue
+        words = [rng.choice(WORDS) for _ in range(rng.randint(3, 30))]
+        if rng.random() < trigger_ratio:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(triggers).upper())
+        corpus.append(" ".join(words))
+    return corpus
+
+def old_match(message: str):
+    """The previous on_message logic, minus the send"""
+    content = message.lower()
+    responses = {keywords: response for keywords, response in AUTO_RESPONSES}
+    for index, (keywords, response) in enumerate(responses.items()):
+        if any(word in content for word in keywords):
+            return index
+    return None
+
+def new_match(message: str, matcher=KeywordMatcher(AUTO_RESPONSES)):
+    return matcher.match(message.lower())
+
+def fast_path_match(message: str, matcher=KeywordMatcher(AUTO_RESPONSES)):
+    if not matcher.should_scan(message):
+        return None
+    return matcher.match(message.lower())
+
+def bench(label: str, func, corpus, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for message in corpus:
+            func(message)
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<8} {len(corpus) / best:>12,.0f} messages/sec")
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    short_ratio = float(sys.argv[3]) if len(sys.argv) > 3 else 0.3
+    corpus = make_corpus(count, ratio, short_ratio)
+
+    mismatches = sum(old_match(m) != new_match(m) or old_match(m) != fast_path_match(m) for m in corpus)
+    print(f"{count:,} messages, {short_ratio:.0%} short, {ratio:.0%} with triggers, mismatches: {mismatches}")
+
+    bench("before", old_match, corpus)
+    bench("after", new_match, corpus)
+    bench("fastpath", fast_path_match, corpus)
@@ -0,0 +1,70 @@
+"""
+SearchableSelectionView search latency on a large option list: the previous
+lowercase + substring scan over every option vs the prebuilt ``SearchIndex``.
+
+Options look like role/member picker entries (a two-word label and a
+"Members: N" description). One option carries accents so accent-insensitive
+and typo queries have a known target; the index's top hit is printed for each.
+
+Usage: python benchmarks/bench_option_search.py [options] [repeats]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from search_index import SearchIndex
+
+SYLLABLES = ["ma", "the", "ti", "ques", "phy", "si", "que", "in", "for", "ré", "seau", "sys", "tè", "me",
+             "al", "go", "chi", "mie", "bio", "lo", "gie", "his", "toi", "re", "jean", "rie", "dup", "ont"]
+TARGET = "Mathématiques Avancées"
+QUERIES = ["mathématiques", "mathematiques", "math av", "Mathématiqeus", "avanc", "ma"]
+
+def make_options(count: int, seed: int = 3):
+    rng = random.Random(seed)
+
+    def word():
+        return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+    options = [{"label": f"{word().capitalize()} {word()}", "value": str(i),
+                "description": f"Members: {rng.randint(0, 500)}"} for i in range(count)]
+    options.insert(count // 2, {"label": TARGET, "value": "target", "description": "Members: 42"})
+    return options
+
+def substring_filter(options, query: str):
+    """The previous SearchableSelectionView.filter_options"""
+    query_lower = query.lower()
+    filtered = []
+    for option in options:
+        label = option.get('label', '').lower()
+        description = option.get('description', '').lower()
+        if query_lower in label or query_lower in description:
+            filtered.append(option)
+    return filtered[:20], len(filtered)
+
+def timed(fn, repeats: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return (time.perf_counter() - started) / repeats * 1000, result
+
+def main(count: int, repeats: int):
+    options = make_options(count)
+    started = time.perf_counter()
+    index = SearchIndex(options)
+    print(f"{len(options):,} options, index built in {(time.perf_counter() - started) * 1000:.0f} ms")
+    print(f"{'query':<16}{'scan ms':>9}{'hits':>7}{'index ms':>10}{'hits':>7}  top hit")
+
+    for query in QUERIES:
+        scan_ms, (_, scan_hits) = timed(lambda: substring_filter(options, query), repeats)
+        index.search(query)  # the first typo search builds the trigram index
+        index_ms, (results, index_hits) = timed(lambda: index.search(query), repeats)
+        top = results[0]["label"] if results else "-"
+        print(f"{query!r:<16}{scan_ms:9.2f}{scan_hits:7}{index_ms:10.2f}{index_hits:7}  {top}")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    count = int(args[0]) if len(args) > 0 else 50_000
+    repeats = int(args[1]) if len(args) > 1 else 5
+    main(count, repeats)
@@ -0,0 +1,108 @@
+"""
+Cost of listing every role with its member count on a synthetic guild:
+``len(role.members)`` per role (discord.py scans every member for each role)
+vs the ``GuildStats`` role index, built once and then read in O(1).
+
+Roles are real ``discord.Role`` objects over a fake member cache shaped like
+discord.py's (``guild._members`` with ``_roles`` snowflake lists), so
+``Role.members`` runs its real code. Both counts are checked to agree, and
+the index is also checked after a stream of role add/remove updates.
+
+Usage: python benchmarks/bench_role_counts.py [members] [roles] [roles_per_member]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import discord
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from guild_index import GuildStats
+
+GUILD_ID = 1
+
+class FakeMember:
+    def __init__(self, member_id: int, role_ids, joined_at: datetime):
+        self.id = member_id
+        self.bot = False
+        self.status = discord.Status.offline
+        self.joined_at = joined_at
+        self._roles = discord.utils.SnowflakeList(role_ids)
+
+    def with_roles(self, role_ids) -> "FakeMember":
+        return FakeMember(self.id, role_ids, self.joined_at)
+
+class FakeGuild:
+    def __init__(self):
+        self.id = GUILD_ID
+        self._members = {}
+
+    @property
+    def members(self):
+        return list(self._members.values())
+
+    @property
+    def member_count(self):
+        return len(self._members)
+
+def make_role(guild: FakeGuild, role_id: int) -> discord.Role:
+    return discord.Role(guild=guild, state=None, data={
+        "id": role_id, "name": f"role-{role_id}", "permissions": "0", "position": role_id,
+        "color": 0, "hoist": False, "managed": False, "mentionable": False,
+    })
+
+def make_guild(members: int, roles: int, roles_per_member: int, seed: int = 42):
+    rng = random.Random(seed)
+    guild = FakeGuild()
+    role_objects = [make_role(guild, 1000 + i) for i in range(roles)]
+    role_ids = [role.id for role in role_objects]
+    now = datetime.now(timezone.utc)
+    for member_id in range(10**6, 10**6 + members):
+        held = rng.sample(role_ids, rng.randint(0, roles_per_member))
+        guild._members[member_id] = FakeMember(member_id, held, now - timedelta(days=rng.randint(0, 365)))
+    return guild, role_objects
+
+def main(members: int, roles: int, roles_per_member: int):
+    guild, role_objects = make_guild(members, roles, roles_per_member)
+    print(f"{members:,} members, {roles} roles, up to {roles_per_member} roles per member")
+
+    started = time.perf_counter()
+    scanned = [len(role.members) for role in role_objects]
+    scan_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    stats = GuildStats(guild)
+    build_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = [stats.role_count(role, guild.member_count) for role in role_objects]
+    read_time = time.perf_counter() - started
+    assert indexed == scanned, "index disagrees with role.members"
+
+    # Keep the index current through role changes, then compare again
+    rng = random.Random(7)
+    role_ids = [role.id for role in role_objects]
+    updates = 10_000
+    started = time.perf_counter()
+    for member_id in rng.sample(list(guild._members), updates):
+        before = guild._members[member_id]
+        after = before.with_roles(rng.sample(role_ids, rng.randint(0, roles_per_member)))
+        guild._members[member_id] = after
+        stats.roles_changed(before, after)
+    update_time = time.perf_counter() - started
+    assert [stats.role_count(role, guild.member_count) for role in role_objects] == \
+           [len(role.members) for role in role_objects], "index drifted after updates"
+
+    print(f"len(role.members) x {roles}: {scan_time * 1000:9.1f} ms per listing")
+    print(f"index build (once):    {build_time * 1000:9.1f} ms")
+    print(f"index read x {roles}:     {read_time * 1000:9.3f} ms per listing")
+    print(f"{updates:,} role updates:   {update_time * 1000:9.1f} ms ({update_time / updates * 1e6:.1f} µs each)")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    members = int(args[0]) if len(args) > 0 else 50_000
+    roles = int(args[1]) if len(args) > 1 else 200
+    roles_per_member = int(args[2]) if len(args) > 2 else 5
+    main(members, roles, roles_per_member)
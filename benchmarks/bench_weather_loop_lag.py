@@ -0,0 +1,98 @@
+"""
+Event-loop lag under concurrent weather lookups, blocking vs async client.
+
+Starts a local stub of the OpenWeatherMap endpoint (in its own thread and
+loop) that answers after a fixed delay, then fires N concurrent lookups while
+a ticker task measures how late the bot's event loop wakes it up. The
+"before" run performs a blocking HTTP call inside the coroutine like the old
+``requests.get`` code did; the "after" run uses ``WeatherClient``.
+
+Usage: python benchmarks/bench_weather_loop_lag.py [concurrency] [delay_ms]
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from weather_client import WeatherClient
+
+TICK = 0.01
+
+def start_stub_server(delay: float) -> str:
+    """Serve a fake weather endpoint from a background thread, return its URL"""
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    address = {}
+
+    async def handler(request):
+        await asyncio.sleep(delay)
+        return web.json_response({"cod": 200, "name": request.query.get("q", ""), "main": {"temp": 21.0}})
+
+    async def start():
+        app = web.Application()
+        app.router.add_get("/data/2.5/weather", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        address["port"] = site._server.sockets[0].getsockname()[1]
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(start())
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return f"http://127.0.0.1:{address['port']}/data/2.5/weather"
+
+async def measure_lag(stop: asyncio.Event, samples: list):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(TICK)
+        samples.append(loop.time() - start - TICK)
+
+async def run(label: str, lookup, concurrency: int):
+    stop = asyncio.Event()
+    samples = []
+    ticker = asyncio.create_task(measure_lag(stop, samples))
+    await asyncio.sleep(TICK * 2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(lookup(f"city{i}") for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+    worst = max(samples) * 1000 if samples else 0.0
+    print(f"{label:<8} wall: {elapsed:6.3f}s   max loop lag: {worst:8.1f}ms")
+
+async def main(concurrency: int, delay: float):
+    url = start_stub_server(delay)
+
+    async def blocking_lookup(city):
+        with urllib.request.urlopen(f"{url}?q={city}", timeout=10) as response:
+            return json.loads(response.read())
+
+    print(f"{concurrency} concurrent lookups, upstream delay {delay * 1000:.0f}ms")
+    await run("before", blocking_lookup, concurrency)
+
+    client = WeatherClient("bench", base_url=url)
+    await client.start()
+    try:
+        await run("after", client.fetch_current, concurrency)
+    finally:
+        await client.close()
+
+if __name__ == "__main__":
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    delay_ms = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    asyncio.run(main(concurrency, delay_ms / 1000))
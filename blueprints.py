@@ -0,0 +1,184 @@
+import json
+import logging
+import os
+from typing import Optional, Dict, List, Tuple, Any, Sequence
+
+import discord
+
+# ========================
+# CATEGORY BLUEPRINTS
+# ========================
+
+BLUEPRINTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blueprints.json")
+DEFAULT_BLUEPRINT = "default"
+
+# Special overwrite targets; any other target is a role name
+EVERYONE = "@everyone"
+SELECTED = "@selected"  # roles picked interactively when the category is created
+
+CHANNEL_TYPES = ("text", "voice")
+
+# Used when blueprints.json is missing or invalid: the historical channel set
+FALLBACK_BLUEPRINTS = {
+    DEFAULT_BLUEPRINT: {
+        "description": "Course module",
+        "channels": ["cours", "tds", "tps", "exams", "bonus"],
+    }
+}
+
+class BlueprintError(ValueError):
+    """Raised when a blueprint definition is invalid"""
+
+def compile_overwrites(rules: Optional[Dict[str, Dict[str, bool]]], where: str) -> Dict[str, discord.PermissionOverwrite]:
+    """Turn ``{target: {permission: bool}}`` rules into PermissionOverwrite objects"""
+    compiled = {}
+    for target, permissions in (rules or {}).items():
+        if not isinstance(permissions, dict):
+            raise BlueprintError(f"{where}: permissions for '{target}' must be an object")
+        try:
+            compiled[target] = discord.PermissionOverwrite(**permissions)
+        except (TypeError, ValueError) as e:
+            raise BlueprintError(f"{where}: invalid permissions for '{target}': {e}")
+    return compiled
+
+class ChannelBlueprint:
+    """One channel of a blueprint, its overwrites already merged with the category's"""
+
+    def __init__(self, name: str, type: str, topic: Optional[str], overwrites: Dict[str, discord.PermissionOverwrite]):
+        self.name = name
+        self.type = type
+        self.topic = topic
+        self.overwrites = overwrites
+
+    @classmethod
+    def from_dict(cls, data: Any, category_overwrites: Dict[str, discord.PermissionOverwrite], where: str) -> "ChannelBlueprint":
+        if isinstance(data, str):
+            data = {"name": data}
+        if not isinstance(data, dict) or not data.get("name"):
+            raise BlueprintError(f"{where}: every channel needs a name")
+
+        channel_type = data.get("type", "text")
+        if channel_type not in CHANNEL_TYPES:
+            raise BlueprintError(f"{where}: unknown channel type '{channel_type}' for '{data['name']}'")
+
+        # Channel rules replace the category rule for the same target
+        overwrites = {**category_overwrites,
+                      **compile_overwrites(data.get("overwrites"), f"{where}/{data['name']}")}
+        return cls(data["name"], channel_type, data.get("topic"), overwrites)
+
+class CategoryBlueprint:
+    """A named category layout: channel set, types, topics and overwrite rules"""
+
+    def __init__(self, name: str, description: str, overwrites: Dict[str, discord.PermissionOverwrite],
+                 channels: List[ChannelBlueprint]):
+        self.name = name
+        self.description = description
+        self.overwrites = overwrites
+        self.channels = channels
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "CategoryBlueprint":
+        if not isinstance(data, dict):
+            raise BlueprintError(f"{name}: blueprint must be an object")
+
+        overwrites = compile_overwrites(data.get("overwrites"), name)
+        channels = [ChannelBlueprint.from_dict(channel, overwrites, name) for channel in data.get("channels", [])]
+        if not channels:
+            raise BlueprintError(f"{name}: blueprint has no channels")
+
+        names = [channel.name for channel in channels]
+        if len(set(names)) != len(names):
+            raise BlueprintError(f"{name}: duplicate channel names")
+        return cls(name, data.get("description", ""), overwrites, channels)
+
+    @property
+    def channel_names(self) -> List[str]:
+        return [channel.name for channel in self.channels]
+
+    @property
+    def uses_selected_roles(self) -> bool:
+        """True when the rules reference roles chosen at creation time"""
+        return SELECTED in self.overwrites or any(SELECTED in c.overwrites for c in self.channels)
+
+    def resolve(self, guild: discord.Guild,
+                selected_roles: Sequence[discord.Role] = (),
+                base: Optional[Dict[Any, discord.PermissionOverwrite]] = None) -> "ResolvedBlueprint":
+        """
+        Bind the rules to a guild's roles once, for any number of categories.
+
+        ``base`` holds overwrites decided outside the blueprint (the privacy
+        prompt); blueprint rules take precedence for the same target.
+        """
+        roles_by_name = {role.name: role for role in guild.roles}
+        missing = set()
+
+        def bind(rules: Dict[str, discord.PermissionOverwrite]) -> Dict[Any, discord.PermissionOverwrite]:
+            bound = dict(base or {})
+            for target, overwrite in rules.items():
+                if target == EVERYONE:
+                    bound[guild.default_role] = overwrite
+                elif target == SELECTED:
+                    for role in selected_roles:
+                        bound[role] = overwrite
+                elif target in roles_by_name:
+                    bound[roles_by_name[target]] = overwrite
+                else:
+                    missing.add(target)
+            return bound
+
+        resolved = ResolvedBlueprint(self, bind(self.overwrites),
+                                     {channel.name: (channel, bind(channel.overwrites)) for channel in self.channels})
+        for target in sorted(missing):
+            logging.warning(f"⚠️ Blueprint '{self.name}': role '{target}' not found in {guild.name}, rule skipped")
+        return resolved
+
+class ResolvedBlueprint:
+    """A blueprint bound to one guild, handing finished overwrites to every create"""
+
+    def __init__(self, blueprint: CategoryBlueprint,
+                 category_overwrites: Dict[Any, discord.PermissionOverwrite],
+                 channels: Dict[str, Tuple[ChannelBlueprint, Dict[Any, discord.PermissionOverwrite]]]):
+        self.blueprint = blueprint
+        self.category_overwrites = category_overwrites
+        self.channels = channels
+
+    async def create_category(self, guild: discord.Guild, name: str) -> discord.CategoryChannel:
+        return await guild.create_category(name=name, overwrites=self.category_overwrites)
+
+    async def create_channel(self, category: discord.CategoryChannel, name: str, position: int):
+        channel, overwrites = self.channels[name]
+        if channel.type == "voice":
+            return await category.guild.create_voice_channel(
+                name, category=category, position=position, overwrites=overwrites
+            )
+        options = {"topic": channel.topic} if channel.topic else {}
+        return await category.guild.create_text_channel(
+            name, category=category, position=position, overwrites=overwrites, **options
+        )
+
+def load_blueprints(path: str = BLUEPRINTS_FILE) -> Dict[str, CategoryBlueprint]:
+    """
+    Load and compile every blueprint in ``path``.
+
+    Falls back to the built-in default layout when the file is missing or
+    invalid, so category creation keeps working.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+        if not isinstance(raw, dict):
+            raise BlueprintError("top level must be an object of named blueprints")
+        blueprints = {name: CategoryBlueprint.from_dict(name, data) for name, data in raw.items()}
+    except FileNotFoundError:
+        logging.info(f"📐 No blueprint file at {path}, using the built-in default")
+        blueprints = {}
+    except (json.JSONDecodeError, BlueprintError) as e:
+        logging.error(f"❌ Invalid blueprint file {path}: {e} (using the built-in default)")
+        blueprints = {}
+
+    if DEFAULT_BLUEPRINT not in blueprints:
+        blueprints[DEFAULT_BLUEPRINT] = CategoryBlueprint.from_dict(
+            DEFAULT_BLUEPRINT, FALLBACK_BLUEPRINTS[DEFAULT_BLUEPRINT]
+        )
+    logging.info(f"📐 Loaded {len(blueprints)} category blueprint(s): {', '.join(blueprints)}")
+    return blueprints
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Optional, List, Tuple, Union, Callable, Awaitable, Sequence, Any
+
+import discord
+
+# ========================
+# BULK MESSAGE DELETION
+# ========================
+
+BULK_DELETE_LIMIT = 100
+# Discord refuses bulk deletes of messages older than 14 days; keep a margin
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+
+class MessageDeleter:
+    """
+    Streaming message deleter.
+
+    Messages younger than 14 days are buffered and removed through the
+    bulk-delete endpoint in chunks of 100. Older messages go through a bounded
+    queue to a single-delete worker paced at ``single_delete_interval``
+    seconds per request. Memory stays bounded by one batch plus the queue.
+
+    Use as ``async with MessageDeleter(channel) as deleter: await deleter.add(msg)``;
+    leaving the block flushes the last batch and drains the old-message queue.
+
+    History comes newest first, so the first old message flushes the pending
+    batch right away instead of leaving it to age behind the paced worker;
+    the 14-day cutoff is recomputed on every flush, and a batch Discord still
+    rejects as too old (400) falls back to single deletes.
+
+    With ``own_messages=True`` (the bot deleting its own messages) a bulk batch
+    refused with Forbidden falls back to the paced single-delete worker, since
+    authors can always delete their own messages without Manage Messages.
+    """
+
+    def __init__(self,
+                 channel: discord.abc.Messageable,
+                 reason: Optional[str] = None,
+                 single_delete_interval: float = 1.0,
+                 queue_size: int = 100,
+                 own_messages: bool = False):
+        self.channel = channel
+        self.own_messages = own_messages
+        self.reason = reason
+        self.single_delete_interval = single_delete_interval
+        self.cutoff = self._cutoff()
+
+        self._batch: List[discord.Message] = []
+        self._old_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._worker: Optional[asyncio.Task] = None
+
+        self.deleted = 0
+        self.failed = 0
+        self.bulk_requests = 0
+        self.single_requests = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.finish()
+        elif self._worker:
+            self._worker.cancel()
+
+    @staticmethod
+    def _cutoff():
+        return discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+
+    async def add(self, message: discord.Message):
+        """Queue one message for deletion, flushing a bulk batch when full or when old messages start"""
+        if message.created_at > self.cutoff:
+            self._batch.append(message)
+            if len(self._batch) >= BULK_DELETE_LIMIT:
+                await self.flush()
+        else:
+            if self._batch:
+                await self.flush()
+            await self._queue_single(message)
+
+    async def _queue_single(self, message: discord.Message):
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._single_delete_worker())
+        # Blocks when the queue is full, so history paging waits for the worker
+        await self._old_queue.put(message)
+
+    async def flush(self):
+        """Bulk-delete the buffered recent messages"""
+        batch, self._batch = self._batch, []
+        self.cutoff = self._cutoff()
+        aged = [message for message in batch if message.created_at <= self.cutoff]
+        if aged:
+            batch = [message for message in batch if message.created_at > self.cutoff]
+            for message in aged:
+                await self._queue_single(message)
+        if not batch:
+            return
+
+        try:
+            await self.channel.delete_messages(batch, reason=self.reason)
+            self.bulk_requests += 1
+            self.deleted += len(batch)
+        except discord.Forbidden:
+            if not self.own_messages:
+                raise
+            logging.warning(f"⚠️ Bulk delete refused in {self.channel}, falling back to single deletes")
+            for message in batch:
+                await self._queue_single(message)
+        except discord.HTTPException as e:
+            if e.status != 400:
+                self.failed += len(batch)
+                logging.warning(f"⚠️ Bulk delete of {len(batch)} messages failed in {self.channel}: {e}")
+                return
+            # Rejected as too old despite the margin: delete them one by one
+            logging.warning(f"⚠️ Bulk delete rejected in {self.channel} ({e}), falling back to single deletes")
+            for message in batch:
+                await self._queue_single(message)
+
+    async def finish(self) -> int:
+        """Flush the last batch, wait for old-message deletes, return the deleted count"""
+        await self.flush()
+        if self._worker:
+            await self._old_queue.put(None)
+            await self._worker
+            self._worker = None
+        return self.deleted
+
+    async def _single_delete_worker(self):
+        while True:
+            message = await self._old_queue.get()
+            if message is None:
+                return
+
+            try:
+                await message.delete()
+                self.single_requests += 1
+                self.deleted += 1
+            except discord.NotFound:
+                pass  # Message already deleted
+            except discord.HTTPException as e:
+                self.failed += 1
+                logging.warning(f"⚠️ Failed to delete message {message.id}: {e}")
+
+            await asyncio.sleep(self.single_delete_interval)
+
+# ========================
+# CONCURRENT CHANNEL CREATION
+# ========================
+
+class ChannelCreationScheduler:
+    """
+    Issues channel creates concurrently, at most ``concurrency`` in flight.
+
+    discord.py's HTTP client tracks every route's rate-limit bucket from the
+    X-RateLimit-* headers and holds requests back once a bucket is exhausted,
+    so the scheduler only bounds the number of in-flight creates. Each create
+    receives its index as an explicit position and results come back in input
+    order, so the final channel ordering stays deterministic.
+    """
+
+    def __init__(self, concurrency: int = 5):
+        self.concurrency = concurrency
+
+    async def run(self,
+                  create: Callable[[str, int], Awaitable[Any]],
+                  names: Sequence[str]) -> List[Tuple[str, Union[Any, discord.HTTPException]]]:
+        """
+        Call ``create(name, position)`` for every name.
+
+        Returns ``(name, channel)`` pairs in input order, with the raised
+        ``discord.HTTPException`` in place of the channel for failed creates.
+        """
+        return await self._run(asyncio.Semaphore(self.concurrency), create, names)
+
+    async def run_categories(self,
+                             create_category: Callable[[str], Awaitable[Any]],
+                             create_channel: Callable[[Any, str, int], Awaitable[Any]],
+                             categories: Sequence[str],
+                             channel_names: Sequence[str],
+                             on_category_done: Optional[Callable[[Tuple], Awaitable[None]]] = None) -> List[Tuple]:
+        """
+        Pipelined batch creation of several categories and their channels.
+
+        Categories are created one after another, in input order, and each
+        category's channels start as soon as it exists, overlapping the next
+        category create. One semaphore bounds every in-flight request.
+
+        Returns ``(category_name, category, channel_results)`` triples in input
+        order; a failed category carries its exception and no channel results.
+        ``on_category_done`` is awaited with each triple once it is complete.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = []
+
+        async def finish(category_name: str, category: Any):
+            results = await self._run(
+                semaphore, lambda name, position: create_channel(category, name, position), channel_names
+            )
+            return await done((category_name, category, results))
+
+        async def done(result: Tuple):
+            if on_category_done:
+                await on_category_done(result)
+            return result
+
+        for category_name in categories:
+            try:
+                async with semaphore:
+                    category = await create_category(category_name)
+            except discord.HTTPException as e:
+                pending.append(asyncio.ensure_future(done((category_name, e, []))))
+                continue
+            pending.append(asyncio.create_task(finish(category_name, category)))
+
+        return list(await asyncio.gather(*pending))
+
+    @staticmethod
+    async def _run(semaphore: asyncio.Semaphore,
+                   create: Callable[[str, int], Awaitable[Any]],
+                   names: Sequence[str]) -> List[Tuple[str, Union[Any, discord.HTTPException]]]:
+        async def create_one(position: int, name: str):
+            async with semaphore:
+                try:
+                    return name, await create(name, position)
+                except discord.HTTPException as e:
+                    return name, e
+
+        return list(await asyncio.gather(*(create_one(i, name) for i, name in enumerate(names))))
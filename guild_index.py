@@ -0,0 +1,330 @@
+import logging
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, List, Tuple
+
+import discord
+
+from search_index import fuzzy_key, fuzzy_matches, trigrams
+
+# ========================
+# GUILD STATISTICS
+# ========================
+
+def _is_online(member: discord.Member) -> bool:
+    return member.status != discord.Status.offline
+
+def _role_ids(member: discord.Member):
+    """Ids of the member's roles without @everyone"""
+    # discord.py's private snowflake list avoids building Role objects per member;
+    # fall back to the public API if a release drops it
+    role_ids = getattr(member, "_roles", None)
+    if role_ids is None:
+        return [role.id for role in member.roles if not role.is_default()]
+    return role_ids
+
+class GuildStats:
+    """
+    Running member counters for one guild.
+
+    Built with a single pass over the member cache, then kept current from
+    member and presence events, so reading them is O(1). Joins are bucketed
+    per UTC day of ``joined_at`` for the members still in the guild, and
+    ``role_members`` maps role ids to member counts, replacing
+    ``len(role.members)`` (a scan of every member per role).
+    """
+
+    def __init__(self, guild: discord.Guild):
+        self.guild_id = guild.id
+        self.online = 0
+        self.bots = 0
+        self.joins_per_day: Counter = Counter()
+        self.role_members: Counter = Counter()
+        for member in guild.members:
+            self.add(member)
+
+    def add(self, member: discord.Member):
+        self.online += _is_online(member)
+        self.bots += member.bot
+        self.role_members.update(_role_ids(member))
+        if member.joined_at:
+            self.joins_per_day[member.joined_at.astimezone(timezone.utc).date()] += 1
+
+    def remove(self, member: discord.Member):
+        self.online -= _is_online(member)
+        self.bots -= member.bot
+        self.role_members.subtract(_role_ids(member))
+        if member.joined_at:
+            day = member.joined_at.astimezone(timezone.utc).date()
+            self.joins_per_day[day] -= 1
+            if self.joins_per_day[day] <= 0:
+                del self.joins_per_day[day]
+
+    def presence_changed(self, before: discord.Member, after: discord.Member):
+        self.online += _is_online(after) - _is_online(before)
+
+    def roles_changed(self, before: discord.Member, after: discord.Member):
+        before_roles, after_roles = set(_role_ids(before)), set(_role_ids(after))
+        self.role_members.subtract(before_roles - after_roles)
+        self.role_members.update(after_roles - before_roles)
+
+    def role_deleted(self, role: discord.Role):
+        self.role_members.pop(role.id, None)
+
+    def role_count(self, role: discord.Role, member_count: int) -> int:
+        """Members holding ``role``; everyone holds the default role"""
+        if role.is_default():
+            return member_count
+        return self.role_members.get(role.id, 0)
+
+    def humans(self, member_count: int) -> int:
+        return member_count - self.bots
+
+    def recent_joins(self, days: int = 7, today: Optional[date] = None) -> int:
+        """Members still in the guild who joined within the last ``days`` days"""
+        today = today or datetime.now(timezone.utc).date()
+        return sum(self.joins_per_day.get(today - timedelta(days=offset), 0) for offset in range(days + 1))
+
+class GuildStatsTracker:
+    """
+    ``GuildStats`` for every guild the bot is in.
+
+    Stats are built lazily on first read (the member cache is complete by
+    then) and dropped on reconnect, so a stale counter never outlives the
+    cache it was built from. Events for guilds without stats are ignored.
+    """
+
+    def __init__(self):
+        self._stats: Dict[int, GuildStats] = {}
+
+    def get(self, guild: discord.Guild) -> GuildStats:
+        stats = self._stats.get(guild.id)
+        if stats is None:
+            stats = self._stats[guild.id] = GuildStats(guild)
+            logging.info(f"📊 Built member statistics for {guild.name} ({guild.member_count} members)")
+        return stats
+
+    def reset(self, guild: Optional[discord.Guild] = None):
+        if guild is None:
+            self._stats.clear()
+        else:
+            self._stats.pop(guild.id, None)
+
+    def member_join(self, member: discord.Member):
+        stats = self._stats.get(member.guild.id)
+        if stats:
+            stats.add(member)
+
+    def member_remove(self, member: discord.Member):
+        stats = self._stats.get(member.guild.id)
+        if stats:
+            stats.remove(member)
+
+    def presence_update(self, before: discord.Member, after: discord.Member):
+        stats = self._stats.get(after.guild.id)
+        if stats:
+            stats.presence_changed(before, after)
+
+    def member_update(self, before: discord.Member, after: discord.Member):
+        stats = self._stats.get(after.guild.id)
+        if stats and set(_role_ids(before)) != set(_role_ids(after)):
+            stats.roles_changed(before, after)
+
+    def role_delete(self, role: discord.Role):
+        stats = self._stats.get(role.guild.id)
+        if stats:
+            stats.role_deleted(role)
+
+    def role_count(self, role: discord.Role) -> int:
+        """O(1) replacement for ``len(role.members)``"""
+        return self.get(role.guild).role_count(role, role.guild.member_count)
+
+# ========================
+# NAME INDEX
+# ========================
+
+CATEGORY = "category"
+TEXT = "text"
+VOICE = "voice"
+OTHER = "other"
+
+def fold(name: str) -> str:
+    return name.casefold()
+
+def channel_kind(channel: discord.abc.GuildChannel) -> str:
+    if isinstance(channel, discord.CategoryChannel):
+        return CATEGORY
+    if isinstance(channel, discord.TextChannel):
+        return TEXT
+    if isinstance(channel, discord.VoiceChannel):
+        return VOICE
+    return OTHER
+
+class NameIndex:
+    """
+    Case-folded name -> objects map for one guild's channels and roles.
+
+    Names are not unique on Discord, so every key holds a bucket of all the
+    objects sharing it. Lookups prefer an exact-case match and otherwise take
+    the bucket's first object in guild order, which is what
+    ``discord.utils.get(guild.categories, name=...)`` returned before.
+
+    Channel names are also posted in a trigram index (per channel kind, over
+    accent-free keys) so ``suggest`` ranks near misses by shared trigrams
+    without scoring every channel of the guild.
+    """
+
+    def __init__(self, guild: discord.Guild):
+        self.guild_id = guild.id
+        self.channels: Dict[Tuple[str, str], List[discord.abc.GuildChannel]] = defaultdict(list)
+        self.roles: Dict[str, List[discord.Role]] = defaultdict(list)
+        # kind -> trigram -> fuzzy keys, and (kind, fuzzy key) -> case-folded names
+        self.postings: Dict[str, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
+        self.fuzzy_names: Dict[Tuple[str, str], set] = defaultdict(set)
+        for channel in guild.channels:
+            self.add_channel(channel)
+        for role in guild.roles:
+            self.add_role(role)
+
+    @staticmethod
+    def _discard(buckets: Dict, key, obj):
+        bucket = buckets.get(key)
+        if bucket is None:
+            return
+        bucket[:] = [item for item in bucket if item.id != obj.id]
+        if not bucket:
+            del buckets[key]
+
+    @staticmethod
+    def _pick(bucket: List, name: str):
+        if not bucket:
+            return None
+        return min(bucket, key=lambda item: (item.name != name, item.position, item.id))
+
+    def add_channel(self, channel: discord.abc.GuildChannel):
+        kind, name = channel_kind(channel), fold(channel.name)
+        self.channels[(kind, name)].append(channel)
+
+        key = fuzzy_key(name)
+        names = self.fuzzy_names[(kind, key)]
+        if not names:
+            for gram in trigrams(key):
+                self.postings[kind][gram].add(key)
+        names.add(name)
+
+    def remove_channel(self, channel: discord.abc.GuildChannel):
+        kind, name = channel_kind(channel), fold(channel.name)
+        self._discard(self.channels, (kind, name), channel)
+        if (kind, name) in self.channels:
+            return
+
+        key = fuzzy_key(name)
+        names = self.fuzzy_names.get((kind, key))
+        if names is None:
+            return
+        names.discard(name)
+        if names:
+            return
+        del self.fuzzy_names[(kind, key)]
+        for gram in trigrams(key):
+            keys = self.postings[kind][gram]
+            keys.discard(key)
+            if not keys:
+                del self.postings[kind][gram]
+
+    def add_role(self, role: discord.Role):
+        self.roles[fold(role.name)].append(role)
+
+    def remove_role(self, role: discord.Role):
+        self._discard(self.roles, fold(role.name), role)
+
+    def category(self, name: str) -> Optional[discord.CategoryChannel]:
+        return self._pick(self.channels.get((CATEGORY, fold(name))), name)
+
+    def text_channel(self, name: str,
+                     category: Optional[discord.CategoryChannel] = None) -> Optional[discord.TextChannel]:
+        """Text channel called ``name``, restricted to ``category`` when given"""
+        bucket = self.channels.get((TEXT, fold(name)))
+        if bucket and category is not None:
+            bucket = [channel for channel in bucket if channel.category_id == category.id]
+        return self._pick(bucket, name)
+
+    def role(self, name: str) -> Optional[discord.Role]:
+        return self._pick(self.roles.get(fold(name)), name)
+
+    def suggest(self, name: str, kind: str = CATEGORY, limit: int = 5,
+                category: Optional[discord.CategoryChannel] = None) -> List[discord.abc.GuildChannel]:
+        """
+        Channels of ``kind`` whose names best match ``name``, best first.
+
+        Only keys sharing the query's rarer trigrams are scored (Dice
+        coefficient), so the cost follows those posting lists rather than
+        the number of channels. ``category`` restricts the candidates.
+        """
+        matches = fuzzy_matches(trigrams(fuzzy_key(name)), self.postings.get(kind, {}))
+
+        results = []
+        for candidate, _ in sorted(matches.items(), key=lambda item: (-item[1], item[0])):
+            for folded in sorted(self.fuzzy_names[(kind, candidate)]):
+                for channel in sorted(self.channels[(kind, folded)], key=lambda c: (c.position, c.id)):
+                    if category is None or channel.category_id == category.id:
+                        results.append(channel)
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+class NameIndexTracker:
+    """
+    ``NameIndex`` for every guild the bot is in, built lazily on first
+    lookup, dropped on reconnect and kept current from channel and role
+    events. Events for guilds without an index are ignored.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[int, NameIndex] = {}
+
+    def get(self, guild: discord.Guild) -> NameIndex:
+        index = self._indexes.get(guild.id)
+        if index is None:
+            index = self._indexes[guild.id] = NameIndex(guild)
+            logging.info(f"🔎 Built name index for {guild.name} "
+                         f"({len(guild.channels)} channels, {len(guild.roles)} roles)")
+        return index
+
+    def reset(self, guild: Optional[discord.Guild] = None):
+        if guild is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(guild.id, None)
+
+    def channel_create(self, channel: discord.abc.GuildChannel):
+        index = self._indexes.get(channel.guild.id)
+        if index:
+            index.add_channel(channel)
+
+    def channel_delete(self, channel: discord.abc.GuildChannel):
+        index = self._indexes.get(channel.guild.id)
+        if index:
+            index.remove_channel(channel)
+
+    def channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        index = self._indexes.get(after.guild.id)
+        if index:
+            index.remove_channel(before)
+            index.add_channel(after)
+
+    def role_create(self, role: discord.Role):
+        index = self._indexes.get(role.guild.id)
+        if index:
+            index.add_role(role)
+
+    def role_delete(self, role: discord.Role):
+        index = self._indexes.get(role.guild.id)
+        if index:
+            index.remove_role(role)
+
+    def role_update(self, before: discord.Role, after: discord.Role):
+        index = self._indexes.get(after.guild.id)
+        if index:
+            index.remove_role(before)
+            index.add_role(after)
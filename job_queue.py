@@ -0,0 +1,253 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Optional, Dict, List, Set, Any, Callable, Awaitable, Union
+
+import discord
+
+# ========================
+# PERSISTENT JOB QUEUE
+# ========================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    guild_id INTEGER NOT NULL,
+    report_channel_id INTEGER,
+    description TEXT NOT NULL,
+    reason TEXT,
+    concurrency INTEGER NOT NULL DEFAULT 1,
+    status TEXT NOT NULL DEFAULT 'pending',
+    created_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS ops (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    phase INTEGER NOT NULL DEFAULT 0,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    error TEXT,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+# Overwrite target types in the REST payload
+OVERWRITE_ROLE = 0
+OVERWRITE_MEMBER = 1
+
+def delete_channel_op(channel: discord.abc.GuildChannel, phase: int = 0) -> Dict[str, Any]:
+    return {"op": "delete_channel", "channel_id": channel.id, "name": channel.name, "phase": phase}
+
+def category_deletion_ops(categories: List[discord.CategoryChannel]) -> List[Dict[str, Any]]:
+    """
+    Every channel of every category in phase 0, then the categories in phase 1,
+    so channels are deleted in parallel and each category only once emptied
+    """
+    ops = [delete_channel_op(channel) for category in categories for channel in category.channels]
+    ops.extend(delete_channel_op(category, phase=1) for category in categories)
+    return ops
+
+def overwrite_op(channel: discord.abc.GuildChannel,
+                 subject: Union[discord.Role, discord.Member],
+                 overwrite: Optional[discord.PermissionOverwrite]) -> Dict[str, Any]:
+    """Payload for one per-overwrite PUT, or DELETE when ``overwrite`` is None"""
+    payload = {"channel_id": channel.id, "name": channel.name, "target_id": subject.id, "phase": 0}
+    if overwrite is None:
+        return {"op": "delete_overwrite", **payload}
+    allow, deny = overwrite.pair()
+    return {
+        "op": "set_overwrite", **payload,
+        "type": OVERWRITE_ROLE if isinstance(subject, discord.Role) else OVERWRITE_MEMBER,
+        "allow": str(allow.value), "deny": str(deny.value),
+    }
+
+class JobQueue:
+    """
+    SQLite-backed queue of long-running guild mutations.
+
+    A job is stored with every planned REST operation before anything runs,
+    and each operation is checkpointed as it completes. Operations are plain
+    id-based payloads executed through the bot's HTTP client, so a job
+    interrupted by a restart resumes (``resume``) without the gateway cache
+    and without repeating finished operations. Operations of one phase run
+    ``concurrency`` at a time; phases run in order.
+    """
+
+    def __init__(self, path: str = "jobs.db"):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA foreign_keys=ON")
+        self.db.executescript(SCHEMA)
+        self.http: Optional[discord.http.HTTPClient] = None
+        self._running: Set[asyncio.Task] = set()
+
+    def attach(self, http: discord.http.HTTPClient):
+        """Bind the HTTP client used to execute operations"""
+        self.http = http
+
+    def close(self):
+        self.db.close()
+
+    async def shutdown(self):
+        """Cancel running jobs, wait for them to checkpoint as resumable, then close the database"""
+        tasks = [task for task in self._running if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.close()
+
+    # ---- bookkeeping ----
+
+    def submit(self, kind: str, guild_id: int, report_channel_id: Optional[int], description: str,
+               ops: List[Dict[str, Any]], reason: Optional[str] = None, concurrency: int = 1) -> int:
+        """Persist a job and all of its operations; returns the job id"""
+        with self.db:
+            job_id = self.db.execute(
+                "INSERT INTO jobs (kind, guild_id, report_channel_id, description, reason, concurrency, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, guild_id, report_channel_id, description, reason, concurrency, time.time())
+            ).lastrowid
+            self.db.executemany(
+                "INSERT INTO ops (job_id, seq, phase, payload) VALUES (?, ?, ?, ?)",
+                [(job_id, seq, op.get("phase", 0), json.dumps(op)) for seq, op in enumerate(ops)]
+            )
+        logging.info(f"📋 Queued job #{job_id} ({kind}): {len(ops)} operation(s)")
+        return job_id
+
+    def job(self, job_id: int) -> Optional[sqlite3.Row]:
+        return self.db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def unfinished_jobs(self) -> List[sqlite3.Row]:
+        return self.db.execute(
+            "SELECT * FROM jobs WHERE status IN ('pending', 'running') ORDER BY id"
+        ).fetchall()
+
+    def recent_jobs(self, guild_id: int, limit: int = 10) -> List[sqlite3.Row]:
+        return self.db.execute(
+            "SELECT * FROM jobs WHERE guild_id = ? ORDER BY id DESC LIMIT ?", (guild_id, limit)
+        ).fetchall()
+
+    def progress(self, job_id: int) -> Dict[str, int]:
+        """Operation counts by status (pending/done/failed) for a job"""
+        counts = dict.fromkeys(("pending", "done", "failed"), 0)
+        for row in self.db.execute("SELECT status, COUNT(*) FROM ops WHERE job_id = ? GROUP BY status", (job_id,)):
+            counts[row[0]] = row[1]
+        return counts
+
+    def prune(self, older_than: float = 7 * 24 * 3600):
+        """Forget finished jobs older than ``older_than`` seconds"""
+        with self.db:
+            self.db.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+                (time.time() - older_than,)
+            )
+
+    def _checkpoint(self, job_id: int, seq: int, error: Optional[Exception]):
+        with self.db:
+            self.db.execute(
+                "UPDATE ops SET status = ?, error = ? WHERE job_id = ? AND seq = ?",
+                ("failed" if error else "done", str(error) if error else None, job_id, seq)
+            )
+
+    def _set_status(self, job_id: int, status: str):
+        finished_at = time.time() if status in ("done", "failed") else None
+        with self.db:
+            self.db.execute("UPDATE jobs SET status = ?, finished_at = ? WHERE id = ?", (status, finished_at, job_id))
+
+    # ---- execution ----
+
+    async def _execute(self, op: Dict[str, Any], reason: Optional[str]):
+        kind = op["op"]
+        if kind == "delete_channel":
+            await self.http.delete_channel(op["channel_id"], reason=reason)
+        elif kind == "set_overwrite":
+            await self.http.edit_channel_permissions(
+                op["channel_id"], op["target_id"], op["allow"], op["deny"], op["type"], reason=reason
+            )
+        elif kind == "delete_overwrite":
+            await self.http.delete_channel_permissions(op["channel_id"], op["target_id"], reason=reason)
+        else:
+            raise ValueError(f"Unknown job operation '{kind}'")
+
+    async def run(self, job_id: int,
+                  on_done: Optional[Callable[[int], Awaitable[None]]] = None
+                  ) -> List[Union[Exception, str, None]]:
+        """
+        Run (or resume) a job's pending operations.
+
+        Returns one entry per operation in submission order: None on success,
+        the raised exception for failures in this run, or the stored error
+        text for failures recorded by an earlier run. ``on_done`` is awaited
+        with the number of finished operations after each one.
+        """
+        job = self.job(job_id)
+        rows = self.db.execute(
+            "SELECT seq, phase, payload, status, error FROM ops WHERE job_id = ? ORDER BY seq", (job_id,)
+        ).fetchall()
+
+        results: List[Union[Exception, str, None]] = [row["error"] for row in rows]
+        finished = sum(row["status"] != "pending" for row in rows)
+        semaphore = asyncio.Semaphore(job["concurrency"])
+        self._set_status(job_id, "running")
+
+        async def run_one(row):
+            nonlocal finished
+            async with semaphore:
+                try:
+                    await self._execute(json.loads(row["payload"]), job["reason"])
+                    error = None
+                except discord.NotFound:
+                    error = None  # Already gone, e.g. done just before a restart
+                except discord.HTTPException as e:
+                    error = e
+                except Exception as e:
+                    # Connection errors and timeouts fail this op only, never the whole job
+                    logging.warning(f"⚠️ Job #{job_id} operation {row['seq']} failed: {e!r}")
+                    error = e
+            self._checkpoint(job_id, row["seq"], error)
+            results[row["seq"]] = error
+            finished += 1
+            if on_done:
+                try:
+                    await on_done(finished)
+                except Exception as e:
+                    logging.warning(f"⚠️ Job #{job_id} progress update failed: {e}")
+
+        pending = [row for row in rows if row["status"] == "pending"]
+        completed = False
+        task = asyncio.current_task()
+        self._running.add(task)
+        try:
+            for phase in sorted({row["phase"] for row in pending}):
+                await asyncio.gather(*(run_one(row) for row in pending if row["phase"] == phase))
+            completed = True
+        finally:
+            self._running.discard(task)
+            if completed:
+                failed = any(error is not None for error in results)
+                self._set_status(job_id, "failed" if failed else "done")
+            else:
+                # Interrupted (cancelled on shutdown): unfinished ops stay pending for resume
+                self._set_status(job_id, "pending")
+        logging.info(f"📋 Job #{job_id} ({job['kind']}) finished: "
+                     f"{sum(e is None for e in results)}/{len(results)} operation(s) succeeded")
+        return results
+
+    async def resume(self, on_finished: Optional[Callable[[sqlite3.Row, List], Awaitable[None]]] = None):
+        """Resume every job left pending or running by a previous process"""
+        for job in self.unfinished_jobs():
+            logging.info(f"♻️ Resuming job #{job['id']} ({job['kind']}): {job['description']}")
+            try:
+                results = await self.run(job["id"])
+            except Exception as e:
+                logging.error(f"❌ Failed to resume job #{job['id']}: {e}")
+                continue
+            if on_finished:
+                await on_finished(job, results)
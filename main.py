@@ -2,11 +2,19 @@ import discord
 import os
 import random
 import logging
-import requests
 import asyncio
+import aiohttp
 from discord.ext import commands
 from dotenv import load_dotenv
 from ui_system import *
+from weather_client import WeatherClient
+from auto_responses import AUTO_RESPONSES, KeywordMatcher, AutoResponseLimiter
+from bulk_ops import MessageDeleter, ChannelCreationScheduler
+from planner import OverwritePlan
+from job_queue import JobQueue, category_deletion_ops
+from blueprints import load_blueprints, DEFAULT_BLUEPRINT
+from guild_index import GuildStatsTracker, NameIndexTracker, TEXT
+from search_index import fuzzy_key
 import sys
 from datetime import datetime, timezone
 
@@ -22,7 +30,54 @@ TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 OPENWEATHER_API_KEY = os.getenv('API_KEY_OPEN_WEATHER')
 
 intents = discord.Intents.all()
-bot = commands.Bot(command_prefix="!", intents=intents, case_insensitive=True)
+weather_client = WeatherClient(OPENWEATHER_API_KEY)
+keyword_matcher = KeywordMatcher(AUTO_RESPONSES)
+auto_response_limiter = AutoResponseLimiter(capacity=1, per=10.0)
+channel_scheduler = ChannelCreationScheduler(concurrency=5)
+category_blueprints = load_blueprints()
+job_queue = JobQueue(os.getenv("JOBS_DB", "jobs.db"))
+CHANNEL_DELETE_WORKERS = int(os.getenv("CHANNEL_DELETE_WORKERS", "5"))
+guild_stats = GuildStatsTracker()
+name_index = NameIndexTracker()
+
+class AutoChannelBot(commands.Bot):
+    """Bot subclass owning the long-lived resources shared by commands"""
+
+    async def setup_hook(self):
+        await weather_client.start()
+
+        # Resume bulk jobs interrupted by a restart; they only need the HTTP client
+        job_queue.attach(self.http)
+        job_queue.prune()
+        self.loop.create_task(job_queue.resume(on_finished=self.report_resumed_job))
+
+    async def report_resumed_job(self, job, results):
+        """Tell the channel a job was started from that it finished after a restart"""
+        await self.wait_until_ready()
+        channel = self.get_channel(job["report_channel_id"]) if job["report_channel_id"] else None
+        if channel is None:
+            return
+
+        failed = [error for error in results if error is not None]
+        embed = discord.Embed(
+            title=f"♻️ Job #{job['id']} resumed and finished",
+            description=f"**{job['description']}**\n"
+                        f"✅ {len(results) - len(failed)}/{len(results)} operations done"
+                        + (f"\n❌ {len(failed)} failed" if failed else ""),
+            color=discord.Color.green() if not failed else discord.Color.orange()
+        )
+        try:
+            await channel.send(embed=embed)
+        except discord.HTTPException:
+            pass
+
+    async def close(self):
+        # Running jobs checkpoint as resumable before the database closes
+        await job_queue.shutdown()
+        await weather_client.close()
+        await super().close()
+
+bot = AutoChannelBot(command_prefix="!", intents=intents, case_insensitive=True)
 
 # ========================
 # EVENTS
@@ -30,6 +85,10 @@ bot = commands.Bot(command_prefix="!", intents=intents, case_insensitive=True)
 
 @bot.event
 async def on_ready():
+    # A (re)connect refills the caches; rebuild stats and name indexes from them on demand
+    guild_stats.reset()
+    name_index.reset()
+
     print(f'✅ We have logged in as {bot.user}')
     print("✅ Bot is starting ...")
     print("-----------------------------------------")
@@ -40,25 +99,63 @@ async def on_ready():
     for guild in bot.guilds:
         print(f'✅ Connected to: {guild.name} (ID: {guild.id})')
 
+@bot.event
+async def on_member_join(member):
+    guild_stats.member_join(member)
+
+@bot.event
+async def on_member_remove(member):
+    guild_stats.member_remove(member)
+
+@bot.event
+async def on_presence_update(before, after):
+    guild_stats.presence_update(before, after)
+
+@bot.event
+async def on_member_update(before, after):
+    guild_stats.member_update(before, after)
+
+@bot.event
+async def on_guild_role_create(role):
+    name_index.role_create(role)
+
+@bot.event
+async def on_guild_role_update(before, after):
+    name_index.role_update(before, after)
+
+@bot.event
+async def on_guild_role_delete(role):
+    guild_stats.role_delete(role)
+    name_index.role_delete(role)
+
+@bot.event
+async def on_guild_channel_create(channel):
+    name_index.channel_create(channel)
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    name_index.channel_update(before, after)
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    name_index.channel_delete(channel)
+
+@bot.event
+async def on_guild_remove(guild):
+    guild_stats.reset(guild)
+    name_index.reset(guild)
+
 @bot.event
 async def on_message(message):
     if message.author == bot.user:  
         return
 
-    content = message.content.lower()
-    responses = {
-        ("hello", "hi", "salam", "wa fen", "ahlan", "salam w 3lykom"): ["salam w 3lykom", "Ach endek alkhawa"],
-        ("arawkan","ajihna"): [
-            "Théoriquement", "plus ou moins", "Next", 
-            "Tout ce qu'on a vu", "Pas de question ?", 
-            "7yed telephone", "Parfait !", "Madmoiselle",
-            "Pas de goblet sur table", "C'est la pire des solutions !!"
-            "Ehhh, Aji lhna fen ghadi !",
-        ]
-    }
+    # Fast path: skip bots and messages that cannot contain any trigger
+    if keyword_matcher.should_scan(message.content, message.author.bot):
+        response = keyword_matcher.response_for(message.content.lower())
 
-    for keywords, response in responses.items():
-        if any(word in content for word in keywords):
+        # Per-channel token bucket: triggers inside one window get one reply
+        if response is not None and auto_response_limiter.try_acquire(message.channel.id):
             if isinstance(response, list):
                 chosen = random.choice(response)
                 await message.channel.send(chosen)
@@ -66,7 +163,6 @@ async def on_message(message):
             else:
                 await message.channel.send(response)
                 logging.info(f"Sent greeting in {message.channel}")
-            break
 
     await bot.process_commands(message)
 
@@ -92,11 +188,12 @@ async def server_info(ctx):
     """Display comprehensive server information with interactive features"""
     guild = ctx.guild
     
-    # Calculate various statistics
+    # Running counters, kept current from member and presence events
+    stats = guild_stats.get(guild)
     total_members = guild.member_count
-    online_members = len([m for m in guild.members if m.status != discord.Status.offline])
-    bot_count = len([m for m in guild.members if m.bot])
-    human_count = total_members - bot_count
+    online_members = stats.online
+    bot_count = stats.bots
+    human_count = stats.humans(total_members)
     
     text_channels = len(guild.text_channels)
     voice_channels = len(guild.voice_channels)
@@ -185,11 +282,59 @@ async def server_info(ctx):
     )
     
     # Create interactive view for additional info
-    view = ServerInfoView(ctx.author, guild)
+    view = ServerInfoView(ctx.author, guild, stats=stats)
     
     message = await ctx.send(embed=embed, view=view)
     logging.info(f"Server info displayed for {ctx.author} in {guild.name}")
 
+# ========================
+# NAME RESOLUTION
+# ========================
+
+CREATE_NEW = "__create__"
+
+async def _resolve_near_miss(ctx, name: str, candidates: list, what: str, create_label: str = None):
+    """Pick a near match for an unknown name; returns the channel, CREATE_NEW or None"""
+    # Equal up to accents, case and separators: no need to ask
+    key = fuzzy_key(name)
+    same = [candidate for candidate in candidates if fuzzy_key(candidate.name) == key]
+    if len(same) == 1:
+        return same[0]
+    if not candidates:
+        return CREATE_NEW if create_label else None
+
+    options = [
+        {
+            "label": candidate.name[:100],
+            "value": str(candidate.id),
+            "description": f"in {candidate.category.name}"[:100] if getattr(candidate, "category", None) else None,
+            "emoji": "📁" if isinstance(candidate, discord.CategoryChannel) else "💬"
+        }
+        for candidate in candidates
+    ]
+    if create_label:
+        options.append({"label": create_label[:100], "value": CREATE_NEW, "emoji": "➕"})
+
+    view = SelectionView(author=ctx.author, options=options, placeholder="Did you mean...?", timeout=30.0)
+    embed = discord.Embed(
+        title=f"🔎 {what} `{name}` not found",
+        description="Did you mean one of these?",
+        color=discord.Color.orange()
+    )
+    message = await ctx.send(embed=embed, view=view)
+    await view.wait()
+    try:
+        await message.delete()
+    except discord.HTTPException:
+        pass
+
+    if not view.confirmed or not view.selected_values:
+        return None
+    value = view.selected_values[0]
+    if value == CREATE_NEW:
+        return CREATE_NEW
+    return next((candidate for candidate in candidates if str(candidate.id) == value), None)
+
 # ========================
 # COMMANDS
 # ========================
@@ -222,15 +367,24 @@ async def create_channel_in_category(ctx, category_name: str = None, channel_nam
         return
     
     try:
-        # Check if category exists
-        category = discord.utils.get(guild.categories, name=category_name)
+        # Check if category exists, offering near matches before creating a new one
+        names = name_index.get(guild)
+        category = names.category(category_name)
+        if category is None:
+            resolved = await _resolve_near_miss(
+                ctx, category_name, names.suggest(category_name), "Category",
+                create_label=f"Create new category '{category_name}'"
+            )
+            if resolved is None:
+                await ctx.send("🚫 Channel creation cancelled.", delete_after=5)
+                return
+            if resolved is not CREATE_NEW:
+                category = resolved
+                category_name = category.name
         category_exists = category is not None
         
         # Check if channel already exists
-        if category:
-            existing_channel = discord.utils.get(guild.text_channels, name=channel_name, category=category)
-        else:
-            existing_channel = discord.utils.get(guild.text_channels, name=channel_name)
+        existing_channel = names.text_channel(channel_name, category=category)
         
         if existing_channel:
             embed = discord.Embed(
@@ -422,7 +576,7 @@ async def create_channel_interactive(ctx, channel_name: str = None):
     
     try:
         # Check if channel already exists
-        existing_channel = discord.utils.get(guild.text_channels, name=channel_name)
+        existing_channel = name_index.get(guild).text_channel(channel_name)
         if existing_channel:
             embed = discord.Embed(
                 title="⚠️ Channel Already Exists",
@@ -620,135 +774,187 @@ async def channel_creation_error(ctx, error):
 # UPDATED CREATE CATEGORIES COMMAND
 # =================================
 
+BATCH_FLAGS = ("--batch", "-b")
+BLUEPRINT_FLAGS = ("--blueprint", "--bp", "-t")
+
+async def _prompt_access_roles(ctx, guild, label: str, on_empty: str):
+    """Ask which roles may access the category; empty (after sending ``on_empty``) when there are none"""
+    # Get eligible roles (excluding @everyone and roles above bot)
+    eligible_roles = [role for role in guild.roles 
+                    if role.name != "@everyone" 
+                    and role < guild.me.top_role
+                    and not role.managed]  # Exclude bot roles
+    
+    if not eligible_roles:
+        await ctx.send(f"⚠️ No eligible roles found. {on_empty}", delete_after=5)
+        return []
+
+    # Create role selection options
+    role_options = [
+        {"label": role.name, "value": str(role.id), "description": f"Members: {guild_stats.role_count(role)}"}
+        for role in eligible_roles[:25]  # Discord limit of 25 options
+    ]
+    
+    role_view = SelectionView(
+        author=ctx.author,
+        options=role_options,
+        placeholder="Select roles that can access this category...",
+        min_values=1,
+        max_values=min(25, len(role_options)),
+        timeout=60.0
+    )
+    
+    embed = discord.Embed(
+        title=f"🔑 Role Selection: {label}",
+        description="Select which roles should have access to this private category:",
+        color=discord.Color.blue()
+    )
+    embed.set_footer(text="💡 Tip: You can select multiple roles")
+    
+    role_msg = await ctx.send(embed=embed, view=role_view)
+    try:
+        await role_view.wait()
+    finally:
+        try:
+            await role_msg.delete()
+        except (discord.NotFound, discord.HTTPException):
+            pass  # Message already deleted or error occurred
+    
+    if not (role_view.confirmed and role_view.selected_values):
+        await ctx.send(f"⚠️ No roles selected or timed out. {on_empty}", delete_after=5)
+        return []
+
+    roles = [guild.get_role(int(role_id)) for role_id in role_view.selected_values]
+    roles = [role for role in roles if role is not None]  # Filter out None values
+    if not roles:
+        await ctx.send(f"⚠️ No valid roles selected. {on_empty}", delete_after=5)
+    return roles
+
+async def _prompt_category_access(ctx, guild, label: str):
+    """Ask for privacy then allowed roles; returns (is_private, roles, overwrites) or None on timeout"""
+    privacy_msg = None
+
+    try:
+        # Step 1: Privacy selection using SelectionView
+        privacy_options = [
+            {"label": "🔒 Private", "value": "private", "description": "Only selected roles can see this category"},
+            {"label": "🌍 Public", "value": "public", "description": "Everyone can see this category"}
+        ]
+        
+        privacy_view = SelectionView(
+            author=ctx.author,
+            options=privacy_options,
+            placeholder="Choose privacy setting...",
+            min_values=1,
+            max_values=1,
+            timeout=30.0
+        )
+        
+        embed = discord.Embed(
+            title=f"🏗️ Category Privacy: {label}",
+            description="Should this category be private or public?",
+            color=discord.Color.blue()
+        )
+        privacy_msg = await ctx.send(embed=embed, view=privacy_view)
+        
+        await privacy_view.wait()
+        if privacy_view.confirmed is None or not privacy_view.selected_values:
+            return None
+    finally:
+        try:
+            if privacy_msg:
+                await privacy_msg.delete()
+        except (discord.NotFound, discord.HTTPException):
+            pass  # Message already deleted or error occurred
+
+    # Step 2: Handle private category setup
+    if privacy_view.selected_values[0] != "private":
+        return False, [], {}
+
+    roles = await _prompt_access_roles(ctx, guild, label, "Creating public category instead.")
+    if not roles:
+        return False, [], {}
+
+    # Set up permissions
+    overwrites = {
+        guild.default_role: discord.PermissionOverwrite(view_channel=False)
+    }
+    for role in roles:
+        overwrites[role] = discord.PermissionOverwrite(
+            view_channel=True,
+            read_messages=True,
+            send_messages=True
+        )
+    return True, roles, overwrites
+
+def _add_access_field(embed: discord.Embed, is_private: bool, roles):
+    if is_private and roles:
+        role_mentions = [role.mention for role in roles if role]
+        embed.add_field(
+            name="🔒 Accessible by", 
+            value="\n".join(role_mentions) if role_mentions else "No valid roles",
+            inline=False
+        )
+    else:
+        embed.add_field(
+            name="🌍 Visibility",
+            value="Public - Everyone can see this category",
+            inline=False
+        )
+
 @bot.command(aliases=["categories", "cats"])
 @commands.has_permissions(administrator=True)
 async def create_categories(ctx, *categories: str):
 
     """Create categories with optional privacy settings and role selection"""
-    text_channels = ["cours", "tds", "tps", "exams", "bonus"]
     guild = ctx.guild
+
+    if categories and categories[0].lower() in BLUEPRINT_FLAGS:
+        if len(categories) < 2 or categories[1] not in category_blueprints:
+            await ctx.send(
+                f"❌ Unknown blueprint. Available: {', '.join(f'`{name}`' for name in category_blueprints)}",
+                delete_after=10
+            )
+            return
+        blueprint = category_blueprints[categories[1]]
+        return await _create_categories_batch(ctx, categories[2:], blueprint)
+
+    if categories and categories[0].lower() in BATCH_FLAGS:
+        return await _create_categories_batch(ctx, categories[1:])
+
+    default_blueprint = category_blueprints[DEFAULT_BLUEPRINT]
     
     logging.info(f"🏗️ Starting category creation in {guild.name} by {ctx.author}")
     
     for category_name in categories:
-        if discord.utils.get(guild.categories, name=category_name):
+        if name_index.get(guild).category(category_name):
             await ctx.send(f"⚠️ Category `{category_name}` already exists!", delete_after=5)
             continue
 
-        privacy_msg = None
-        role_msg = None
-        
         try:
-            # Step 1: Privacy selection using SelectionView
-            privacy_options = [
-                {"label": "🔒 Private", "value": "private", "description": "Only selected roles can see this category"},
-                {"label": "🌍 Public", "value": "public", "description": "Everyone can see this category"}
-            ]
-            
-            privacy_view = SelectionView(
-                author=ctx.author,
-                options=privacy_options,
-                placeholder="Choose privacy setting...",
-                min_values=1,
-                max_values=1,
-                timeout=30.0
-            )
-            
-            embed = discord.Embed(
-                title=f"🏗️ Category Privacy: {category_name}",
-                description="Should this category be private or public?",
-                color=discord.Color.blue()
-            )
-            privacy_msg = await ctx.send(embed=embed, view=privacy_view)
-            
-            await privacy_view.wait()
-            if privacy_view.confirmed is None or not privacy_view.selected_values:
+            access = await _prompt_category_access(ctx, guild, category_name)
+            if access is None:
                 await ctx.send("⏰ Timed out. Skipping category creation.", delete_after=5)
                 continue
-                
-            is_private = privacy_view.selected_values[0] == "private"
-            overwrites = {}
-            roles = []
-            
-            # Step 2: Handle private category setup
-            if is_private:
-                # Get eligible roles (excluding @everyone and roles above bot)
-                eligible_roles = [role for role in guild.roles 
-                                if role.name != "@everyone" 
-                                and role < guild.me.top_role
-                                and not role.managed]  # Exclude bot roles
-                
-                if not eligible_roles:
-                    await ctx.send("⚠️ No eligible roles found. Creating public category instead.", delete_after=5)
-                    is_private = False
-                else:
-                    # Create role selection options
-                    role_options = [
-                        {"label": role.name, "value": str(role.id), "description": f"Members: {len(role.members)}"}
-                        for role in eligible_roles[:25]  # Discord limit of 25 options
-                    ]
-                    
-                    role_view = SelectionView(
-                        author=ctx.author,
-                        options=role_options,
-                        placeholder="Select roles that can access this category...",
-                        min_values=1,
-                        max_values=min(25, len(role_options)),
-                        timeout=60.0
-                    )
-                    
-                    embed = discord.Embed(
-                        title=f"🔑 Role Selection: {category_name}",
-                        description="Select which roles should have access to this private category:",
-                        color=discord.Color.blue()
-                    )
-                    embed.set_footer(text="💡 Tip: You can select multiple roles")
-                    
-                    role_msg = await ctx.send(embed=embed, view=role_view)
-                    await role_view.wait()
-                    
-                    # Fix: Use selected_values instead of selected_roles
-                    if role_view.confirmed and role_view.selected_values:
-                        roles = [guild.get_role(int(role_id)) for role_id in role_view.selected_values]
-                        roles = [role for role in roles if role is not None]  # Filter out None values
-                        
-                        if roles:
-                            # Set up permissions
-                            overwrites = {
-                                guild.default_role: discord.PermissionOverwrite(view_channel=False)
-                            }
-                            for role in roles:
-                                overwrites[role] = discord.PermissionOverwrite(
-                                    view_channel=True,
-                                    read_messages=True,
-                                    send_messages=True
-                                )
-                        else:
-                            await ctx.send("⚠️ No valid roles selected. Creating public category instead.", delete_after=5)
-                            is_private = False
-                    else:
-                        await ctx.send("⚠️ No roles selected or timed out. Creating public category instead.", delete_after=5)
-                        is_private = False
-
-            # Always initialize overwrites as a dict
-            final_overwrites = overwrites if is_private else {}
+            is_private, roles, overwrites = access
+            resolved = default_blueprint.resolve(guild, roles, base=overwrites)
 
             # Create category with permissions
-            category = await guild.create_category(
-                name=category_name,
-                overwrites=final_overwrites
-            )
+            category = await resolved.create_category(guild, category_name)
             logging.info(f"📁 Created category '{category_name}' in {guild.name}")
 
-            # Create channels
+            # Create channels concurrently (explicit positions keep the order deterministic)
             created = []
-            for ch_name in text_channels:
-                try:
-                    channel = await guild.create_text_channel(ch_name, category=category)
+            results = await channel_scheduler.run(
+                lambda ch_name, position: resolved.create_channel(category, ch_name, position),
+                default_blueprint.channel_names
+            )
+            for ch_name, result in results:
+                if isinstance(result, discord.HTTPException):
+                    logging.error(f"Failed to create channel '{ch_name}': {result}")
+                else:
                     created.append(ch_name)
                     logging.info(f"📄 Created channel '{ch_name}' in '{category_name}'")
-                except discord.HTTPException as e:
-                    logging.error(f"Failed to create channel '{ch_name}': {e}")
 
             # Final response
             embed = discord.Embed(
@@ -756,21 +962,7 @@ async def create_categories(ctx, *categories: str):
                 description=f"**Channels:** {', '.join(created)}",
                 color=discord.Color.green()
             )
-            
-            if is_private and roles:
-                role_mentions = [role.mention for role in roles if role]
-                embed.add_field(
-                    name="🔒 Accessible by", 
-                    value="\n".join(role_mentions) if role_mentions else "No valid roles",
-                    inline=False
-                )
-            else:
-                embed.add_field(
-                    name="🌍 Visibility",
-                    value="Public - Everyone can see this category",
-                    inline=False
-                )
-                
+            _add_access_field(embed, is_private, roles)
             embed.set_footer(text=f"Created {len(created)} channels")
             await ctx.send(embed=embed)
 
@@ -783,15 +975,6 @@ async def create_categories(ctx, *categories: str):
         except Exception as e:
             logging.error(f"Unexpected error creating category '{category_name}': {str(e)}")
             await ctx.send(f"❌ Unexpected error creating category `{category_name}`: {str(e)}", delete_after=10)
-        finally:
-            # Cleanup messages
-            try:
-                if privacy_msg:
-                    await privacy_msg.delete()
-                if role_msg:
-                    await role_msg.delete()
-            except (discord.NotFound, discord.HTTPException):
-                pass  # Message already deleted or error occurred
 
     # Final summary
     embed = discord.Embed(
@@ -802,6 +985,137 @@ async def create_categories(ctx, *categories: str):
     await ctx.send(embed=embed)
     logging.info(f"✅ Finished creating categories in {guild.name}")
 
+async def _create_categories_batch(ctx, categories, blueprint=None):
+    """Create every listed category with one access prompt, as one pipelined job"""
+    guild = ctx.guild
+
+    # Skip duplicates in the list and categories that already exist
+    names = []
+    for category_name in dict.fromkeys(categories):
+        if name_index.get(guild).category(category_name):
+            await ctx.send(f"⚠️ Category `{category_name}` already exists!", delete_after=5)
+        else:
+            names.append(category_name)
+
+    if not names:
+        await ctx.send("❌ No new categories to create. Usage: `!cats --batch <name> [name...]` "
+                       "or `!cats --blueprint <blueprint> <name> [name...]`", delete_after=10)
+        return
+
+    logging.info(f"🏗️ Starting batch creation of {len(names)} categories in {guild.name} by {ctx.author}")
+
+    if blueprint is None:
+        blueprint = category_blueprints[DEFAULT_BLUEPRINT]
+        access = await _prompt_category_access(ctx, guild, f"{len(names)} categories")
+        if access is None:
+            await ctx.send("⏰ Timed out. Skipping category creation.", delete_after=5)
+            return
+        is_private, roles, overwrites = access
+    else:
+        # A blueprint carries its own rules; roles are only asked for @selected
+        overwrites = {}
+        roles = []
+        if blueprint.uses_selected_roles:
+            roles = await _prompt_access_roles(ctx, guild, f"{len(names)} × {blueprint.name}",
+                                               "Skipping category creation.")
+            if not roles:
+                return
+        is_private = bool(roles)
+
+    resolved = blueprint.resolve(guild, roles, base=overwrites)
+    channel_names = blueprint.channel_names
+
+    total = len(names)
+    finished = []
+
+    def progress_embed(title, color):
+        embed = discord.Embed(
+            title=title,
+            description=f"**{len(finished)}/{total}** categories done\n"
+                        f"Blueprint `{blueprint.name}`: {', '.join(channel_names)}",
+            color=color
+        )
+        _add_access_field(embed, is_private, roles)
+        return embed
+
+    progress_msg = await ctx.send(embed=progress_embed(f"🏗️ Creating {total} categories...", discord.Color.blue()))
+    # One message for the whole job, edited at most every couple of seconds
+    reporter = ProgressReporter(
+        progress_msg, lambda _: progress_embed(f"🏗️ Creating {total} categories...", discord.Color.blue())
+    )
+
+    async def on_category_done(result):
+        finished.append(result)
+        category_name, category, channel_results = result
+        if isinstance(category, discord.HTTPException):
+            logging.error(f"Category creation failed for '{category_name}': {category}")
+        else:
+            failed = [name for name, channel in channel_results if isinstance(channel, discord.HTTPException)]
+            logging.info(f"📁 Created category '{category_name}' in {guild.name}"
+                         + (f" ({len(failed)} channel(s) failed)" if failed else ""))
+        reporter.update()
+
+    results = await channel_scheduler.run_categories(
+        lambda name: resolved.create_category(guild, name),
+        resolved.create_channel,
+        names,
+        channel_names,
+        on_category_done=on_category_done
+    )
+
+    lines = []
+    failures = 0
+    for category_name, category, channel_results in results:
+        if isinstance(category, discord.HTTPException):
+            failures += 1
+            lines.append(f"❌ **{category_name}**: {category}")
+            continue
+        created = [name for name, channel in channel_results if not isinstance(channel, discord.HTTPException)]
+        if len(created) == len(channel_names):
+            lines.append(f"✅ **{category_name}** ({len(created)} channels)")
+        else:
+            failures += 1
+            lines.append(f"⚠️ **{category_name}** ({len(created)}/{len(channel_names)} channels)")
+
+    embed = progress_embed(
+        "🏁 Category Creation Complete" if not failures else f"⚠️ Category Creation Finished with {failures} problem(s)",
+        discord.Color.green() if not failures else discord.Color.orange()
+    )
+    # Whole lines up to the 1024-character field limit, then a count of the rest
+    category_list = "\n".join(lines)
+    if len(category_list) > 1024:
+        category_list = ""
+        for i, line in enumerate(lines):
+            if len(category_list) + len(line) + 1 > 1000:
+                category_list += f"\n... and {len(lines) - i} more"
+                break
+            category_list += ("\n" if category_list else "") + line
+    embed.insert_field_at(0, name="📁 Categories", value=category_list, inline=False)
+    await reporter.finish(embed=embed)
+    logging.info(f"✅ Finished batch category creation in {guild.name}")
+
+@bot.command(aliases=["blueprints", "bps"])
+@commands.has_permissions(administrator=True)
+async def list_blueprints(ctx):
+    """List the category blueprints available to `!cats --blueprint`"""
+    embed = discord.Embed(
+        title="📐 Category Blueprints",
+        description="Use `!cats --blueprint <name> <category> [category...]`",
+        color=discord.Color.blue()
+    )
+    for name, blueprint in list(category_blueprints.items())[:25]:
+        channels = ", ".join(
+            f"🔊 {channel.name}" if channel.type == "voice" else f"# {channel.name}"
+            for channel in blueprint.channels
+        )
+        access = "🔑 asks for roles" if blueprint.uses_selected_roles else "🌍 no prompt"
+        embed.add_field(
+            name=f"{name}" + (" (default)" if name == DEFAULT_BLUEPRINT else ""),
+            value=f"{blueprint.description or 'No description'}\n{channels}\n{access}"[:1024],
+            inline=False
+        )
+    await ctx.send(embed=embed)
+
 @create_categories.error
 async def create_categories_error(ctx, error):
     """Error handler for create_categories command"""
@@ -831,6 +1145,21 @@ async def create_categories_error(ctx, error):
     except:
         await ctx.send(f"❌ Error: {embed.description}")
 
+async def _delete_categories_job(ctx, categories, description, reason, on_done=None):
+    """Delete categories and their channels as one job; returns (category, error, channel results) each"""
+    # Channels go first, CHANNEL_DELETE_WORKERS at a time, then the emptied categories
+    channels_by_category = [(category, list(category.channels)) for category in categories]
+    job_id = job_queue.submit(
+        "delete_category", ctx.guild.id, ctx.channel.id, description, category_deletion_ops(categories),
+        reason=reason, concurrency=CHANNEL_DELETE_WORKERS
+    )
+    errors = iter(await job_queue.run(job_id, on_done=on_done))
+    channel_results = [[(channel, next(errors)) for channel in channels] for _, channels in channels_by_category]
+    return [
+        (category, next(errors), results)
+        for (category, _), results in zip(channels_by_category, channel_results)
+    ]
+
 @bot.command(aliases=["rmcc"])
 @commands.has_permissions(manage_channels=True)
 async def delete_cat_chan(ctx, *, args: str):
@@ -867,10 +1196,16 @@ async def delete_cat_chan(ctx, *, args: str):
             target_channel = None
             
             # If category is specified, look for channel within that category
+            names = name_index.get(guild)
             if category_name:
-                category = discord.utils.get(guild.categories, name=category_name)
+                category = names.category(category_name) or await _resolve_near_miss(
+                    ctx, category_name, names.suggest(category_name), "Category"
+                )
                 if category:
-                    target_channel = discord.utils.get(category.text_channels, name=channel_name)
+                    category_name = category.name
+                    target_channel = names.text_channel(channel_name, category=category) or await _resolve_near_miss(
+                        ctx, channel_name, names.suggest(channel_name, kind=TEXT, category=category), "Channel"
+                    )
                     if not target_channel:
                         await ctx.send(f"⚠️ Channel `{channel_name}` not found in category `{category_name}`!", delete_after=5)
                         return
@@ -879,11 +1214,15 @@ async def delete_cat_chan(ctx, *, args: str):
                     return
             else:
                 # Look for channel globally across all categories
-                target_channel = discord.utils.get(guild.text_channels, name=channel_name)
+                target_channel = names.text_channel(channel_name) or await _resolve_near_miss(
+                    ctx, channel_name, names.suggest(channel_name, kind=TEXT), "Channel"
+                )
                 if not target_channel:
                     await ctx.send(f"⚠️ Channel `{channel_name}` not found!", delete_after=5)
                     return
             
+            channel_name = target_channel.name
+            
             # Channel deletion confirmation
             confirm_view = ActionConfirmationView(
                 author=ctx.author,
@@ -917,8 +1256,12 @@ async def delete_cat_chan(ctx, *, args: str):
 
         # Handle category deletion
         elif category_name:
-            category = discord.utils.get(guild.categories, name=category_name)
+            names = name_index.get(guild)
+            category = names.category(category_name) or await _resolve_near_miss(
+                ctx, category_name, names.suggest(category_name), "Category"
+            )
             if category:
+                category_name = category.name
                 channels = list(category.channels)
                 
                 # Use DangerConfirmationView for category deletion (more dangerous)
@@ -996,28 +1339,37 @@ async def delete_cat_chan(ctx, *, args: str):
                     )
                     progress_msg = await ctx.send(embed=progress_embed)
                     
+                    def render(finished):
+                        if finished < len(channels):
+                            progress_embed.description = f"Deleting channels {finished}/{len(channels)}..."
+                        else:
+                            progress_embed.description = f"Deleting category '{category_name}'..."
+                        return progress_embed
+                    
+                    reporter = ProgressReporter(progress_msg, render)
+                    
+                    async def on_done(finished):
+                        reporter.update(finished)
+                    
+                    # One resumable job: channels deleted in parallel, then the category
+                    [(_, category_error, channel_results)] = await _delete_categories_job(
+                        ctx, [category], f"Delete category {category_name}",
+                        reason=f"Category deletion by {ctx.author}", on_done=on_done
+                    )
+                    
                     deleted_channels_count = 0
                     failed_channels = []
-                    
-                    # Delete all channels first with progress tracking
-                    for i, channel in enumerate(channels, 1):
-                        try:
-                            progress_embed.description = f"Deleting channel {i}/{len(channels)}: {channel.name}"
-                            await progress_msg.edit(embed=progress_embed)
-                            
-                            await channel.delete(reason=f"Category deletion by {ctx.author}")
+                    for channel, error in channel_results:
+                        if error is None:
                             deleted_channels_count += 1
                             logging.info(f"🗑️ Deleted channel '{channel.name}' in category '{category_name}' by {ctx.author}")
-                        except Exception as e:
-                            failed_channels.append(f"{channel.name}: {str(e)}")
-                            logging.warning(f"⚠️ Failed to delete channel '{channel.name}': {str(e)}")
-                    
-                    # Delete the category
-                    progress_embed.description = f"Deleting category '{category_name}'..."
-                    await progress_msg.edit(embed=progress_embed)
+                        else:
+                            failed_channels.append(f"{channel.name}: {str(error)}")
+                            logging.warning(f"⚠️ Failed to delete channel '{channel.name}': {str(error)}")
                     
                     try:
-                        await category.delete(reason=f"Category deleted by {ctx.author}")
+                        if category_error is not None:
+                            raise category_error  # The category delete itself failed
                         deleted.append(f"Category '{category_name}' ({deleted_channels_count}/{len(channels)} channels)")
                         logging.info(f"🗑️ Deleted category '{category_name}' in {guild.name} by {ctx.author}")
                         
@@ -1044,7 +1396,7 @@ async def delete_cat_chan(ctx, *, args: str):
                             )
                             success_embed.color = discord.Color.orange()
                         
-                        await progress_msg.edit(embed=success_embed)
+                        await reporter.finish(embed=success_embed)
                         
                     except Exception as e:
                         error_embed = discord.Embed(
@@ -1052,7 +1404,7 @@ async def delete_cat_chan(ctx, *, args: str):
                             description=f"Failed to delete category '{category_name}': {str(e)}",
                             color=discord.Color.red()
                         )
-                        await progress_msg.edit(embed=error_embed)
+                        await reporter.finish(embed=error_embed)
                         return
                     
                 elif danger_view.confirmed is False:
@@ -1294,7 +1646,7 @@ async def _handle_channel_deletion(ctx, guild, main_msg):
             options=channel_options,
             placeholder="Select channels to delete...",
             min_values=1,
-            max_values=1,  # Pagination limits to 1 selection at a time
+            max_values=len(channel_options),  # Selection persists across pages
             timeout=60.0,
             items_per_page=20
         )
@@ -1375,12 +1727,16 @@ async def _handle_channel_deletion(ctx, guild, main_msg):
     deleted_count = 0
     failed_channels = []
     
+    def render(state):
+        i, channel = state
+        embed.description = f"Deleting channel {i}/{len(channels_to_delete)}: #{channel.name}"
+        return embed
+    
+    reporter = ProgressReporter(main_msg, render)
+    
     for i, channel in enumerate(channels_to_delete, 1):
         try:
-            # Update progress
-            embed.description = f"Deleting channel {i}/{len(channels_to_delete)}: #{channel.name}"
-            await main_msg.edit(embed=embed)
-            
+            reporter.update((i, channel))
             await channel.delete(reason=f"Deleted by {ctx.author} via interactive deletion")
             deleted_count += 1
             logging.info(f"🗑️ Deleted channel '{channel.name}' by {ctx.author}")
@@ -1407,7 +1763,7 @@ async def _handle_channel_deletion(ctx, guild, main_msg):
                 failed_list += f"\n... and {len(failed_channels) - 5} more"
             embed.add_field(name="Failed Deletions", value=failed_list, inline=False)
     
-    await main_msg.edit(embed=embed, view=None)
+    await reporter.finish(embed=embed, view=None)
 
 async def _handle_category_deletion(ctx, guild, main_msg):
     """Handle category deletion process with explicit channel deletion"""
@@ -1456,7 +1812,7 @@ async def _handle_category_deletion(ctx, guild, main_msg):
             options=category_options,
             placeholder="Select categories to delete...",
             min_values=1,
-            max_values=1,  # Pagination limits to 1 selection at a time
+            max_values=len(category_options),  # Selection persists across pages
             timeout=60.0,
             items_per_page=20
         )
@@ -1549,43 +1905,44 @@ async def _handle_category_deletion(ctx, guild, main_msg):
     total_failed_channels = []
     failed_categories = []
     
-    for i, category in enumerate(categories_to_delete, 1):
-        try:
-            channels = list(category.channels)  # Create a copy of the channels list
-            channel_count = len(channels)
-            
-            # Update progress for category
-            embed.description = f"Processing category {i}/{len(categories_to_delete)}: **{category.name}** ({channel_count} channels)"
-            await main_msg.edit(embed=embed)
-            
-            # Delete all channels in the category first
-            deleted_channels_in_category = 0
-            for j, channel in enumerate(channels, 1):
-                try:
-                    # Update progress for individual channel
-                    embed.description = f"Category {i}/{len(categories_to_delete)}: **{category.name}**\nDeleting channel {j}/{channel_count}: #{channel.name}"
-                    await main_msg.edit(embed=embed)
-                    
-                    await channel.delete(reason=f"Category deletion by {ctx.author} via interactive deletion")
-                    deleted_channels_in_category += 1
-                    total_deleted_channels += 1
-                    logging.info(f"🗑️ Deleted channel '{channel.name}' from category '{category.name}' by {ctx.author}")
-                except Exception as channel_error:
-                    total_failed_channels.append(f"#{channel.name}: {str(channel_error)}")
-                    logging.warning(f"⚠️ Failed to delete channel '{channel.name}': {str(channel_error)}")
-            
-            # Update progress for category deletion
-            embed.description = f"Category {i}/{len(categories_to_delete)}: Deleting category **{category.name}**"
-            await main_msg.edit(embed=embed)
-            
-            # Then delete the category itself
-            await category.delete(reason=f"Deleted by {ctx.author} via interactive deletion")
+    embed.description = f"Deleting {total_channels} channels in {len(categories_to_delete)} categories..."
+    await main_msg.edit(embed=embed)
+    
+    def render(finished):
+        if finished < total_channels:
+            embed.description = f"Deleting channels {finished}/{total_channels} in {len(categories_to_delete)} categories..."
+        else:
+            embed.description = f"Deleting {len(categories_to_delete)} emptied categories..."
+        return embed
+    
+    reporter = ProgressReporter(main_msg, render)
+    
+    async def on_done(finished):
+        reporter.update(finished)
+    
+    # One resumable job: all channels in parallel, then the emptied categories
+    results = await _delete_categories_job(
+        ctx, categories_to_delete, f"Delete {len(categories_to_delete)} categories",
+        reason=f"Category deletion by {ctx.author} via interactive deletion", on_done=on_done
+    )
+    
+    for category, category_error, channel_results in results:
+        deleted_channels_in_category = 0
+        for channel, channel_error in channel_results:
+            if channel_error is None:
+                deleted_channels_in_category += 1
+                total_deleted_channels += 1
+                logging.info(f"🗑️ Deleted channel '{channel.name}' from category '{category.name}' by {ctx.author}")
+            else:
+                total_failed_channels.append(f"#{channel.name}: {str(channel_error)}")
+                logging.warning(f"⚠️ Failed to delete channel '{channel.name}': {str(channel_error)}")
+        
+        if category_error is None:
             total_deleted_categories += 1
-            logging.info(f"🗑️ Deleted category '{category.name}' with {deleted_channels_in_category}/{channel_count} channels by {ctx.author}")
-            
-        except Exception as e:
-            failed_categories.append(f"**{category.name}**: {str(e)}")
-            logging.error(f"❌ Failed to delete category '{category.name}': {str(e)}")
+            logging.info(f"🗑️ Deleted category '{category.name}' with {deleted_channels_in_category}/{len(channel_results)} channels by {ctx.author}")
+        else:
+            failed_categories.append(f"**{category.name}**: {str(category_error)}")
+            logging.error(f"❌ Failed to delete category '{category.name}': {str(category_error)}")
     
     # Final result with detailed information
     if total_deleted_categories == len(categories_to_delete) and not total_failed_channels:
@@ -1632,7 +1989,7 @@ async def _handle_category_deletion(ctx, guild, main_msg):
                 inline=False
             )
     
-    await main_msg.edit(embed=embed, view=None)
+    await reporter.finish(embed=embed, view=None)
 
 @interactive_delete.error
 async def interactive_delete_error(ctx, error):
@@ -1707,11 +2064,8 @@ async def weather(ctx, *, city: str = None):
     message = await ctx.send(embed=loading_embed)
 
     try:
-        # Current weather API call
-        current_url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={OPENWEATHER_API_KEY}&units=metric"
-        
-        current_response = requests.get(current_url, timeout=10)
-        current_data = current_response.json()
+        # Current weather (cached per city, non-blocking shared session)
+        current_data = await weather_client.get_weather(city)
 
         # Debug logging
         logging.info(f"Weather API response for '{city}': {current_data}")
@@ -1740,94 +2094,15 @@ async def weather(ctx, *, city: str = None):
             await message.edit(embed=embed)
             return
 
-        # Safely extract weather data with fallbacks
-        main = current_data.get('main', {})
-        weather_list = current_data.get('weather', [{}])
-        weather = weather_list[0] if weather_list else {}
-        wind = current_data.get('wind', {})
-        clouds = current_data.get('clouds', {})
-        sys_data = current_data.get('sys', {})
-        
-        # Create comprehensive weather embed with safe data extraction
-        embed = discord.Embed(
-            title=f"🌤️ Weather in {current_data.get('name', city)}, {sys_data.get('country', '')}",
-            description=f"**{weather.get('description', 'No description').title()}**",
-            color=_get_weather_color(weather.get('main', 'Clear')),
-            timestamp=datetime.now(timezone.utc)
-        )
+        embed = _build_weather_embed(current_data, city, ctx.author)
         
-        # Main weather info with safe extraction
-        temp = main.get('temp', 0)
-        feels_like = main.get('feels_like', temp)
-        temp_min = main.get('temp_min', temp)
-        temp_max = main.get('temp_max', temp)
-        humidity = main.get('humidity', 0)
-        pressure = main.get('pressure', 0)
-        
-        embed.add_field(
-            name="🌡️ Temperature",
-            value=f"**Current:** {temp:.1f}°C\n"
-                  f"**Feels like:** {feels_like:.1f}°C\n"
-                  f"**Min:** {temp_min:.1f}°C\n"
-                  f"**Max:** {temp_max:.1f}°C",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="💧 Humidity & Pressure",
-            value=f"**Humidity:** {humidity}%\n"
-                  f"**Pressure:** {pressure} hPa\n"
-                  f"**Visibility:** {current_data.get('visibility', 'N/A')}m",
-            inline=True
-        )
-        
-        # Wind and clouds with safe extraction
-        wind_speed = wind.get('speed', 0) * 3.6  # Convert m/s to km/h
-        wind_direction = _get_wind_direction(wind.get('deg', 0))
-        cloud_coverage = clouds.get('all', 0)
-        
-        embed.add_field(
-            name="💨 Wind & Clouds",
-            value=f"**Wind:** {wind_speed:.1f} km/h {wind_direction}\n"
-                  f"**Clouds:** {cloud_coverage}%\n"
-                  f"**Condition:** {weather.get('main', 'Unknown')}",
-            inline=True
-        )
-        
-        # Sunrise/sunset if available
-        if 'sunrise' in sys_data and 'sunset' in sys_data:
-            try:
-                sunrise = datetime.fromtimestamp(sys_data['sunrise']).strftime('%H:%M')
-                sunset = datetime.fromtimestamp(sys_data['sunset']).strftime('%H:%M')
-                embed.add_field(
-                    name="🌅 Sun Times",
-                    value=f"**Sunrise:** {sunrise}\n**Sunset:** {sunset}",
-                    inline=True
-                )
-            except (ValueError, OSError) as e:
-                logging.warning(f"Error parsing sunrise/sunset times: {e}")
-        
-        # Weather icon
-        icon_code = weather.get('icon', '01d')  # Default sunny icon
-        icon_url = f"http://openweathermap.org/img/wn/{icon_code}@2x.png"
-        embed.set_thumbnail(url=icon_url)
-        
-        embed.set_footer(
-            text=f"Requested by {ctx.author.display_name} • Data from OpenWeatherMap",
-            icon_url=ctx.author.display_avatar.url if ctx.author.display_avatar else None
-        )
-        
-        # Add interactive buttons (if WeatherView is defined)
-        try:
-            view = WeatherView(ctx.author, city, current_data)
-            await message.edit(embed=embed, view=view)
-        except NameError:
-            # WeatherView not defined, send without view
-            await message.edit(embed=embed)
+        # Refresh re-fetches through the cached client and rebuilds the same embed
+        view = WeatherView(ctx.author, city, current_data, weather_client.get_weather, _build_weather_embed)
+        await message.edit(embed=embed, view=view)
         
         logging.info(f"Weather data provided for {city} to {ctx.author}")
         
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         embed = discord.Embed(
             title="⌛ Request Timeout",
             description="The weather service is taking too long to respond. Please try again later.",
@@ -1835,7 +2110,7 @@ async def weather(ctx, *, city: str = None):
         )
         await message.edit(embed=embed)
         logging.error(f"Weather API timeout for city: {city}")
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         embed = discord.Embed(
             title="❌ Connection Error",
             description="Unable to connect to the weather service. Please check your internet connection.",
@@ -1870,6 +2145,87 @@ async def weather(ctx, *, city: str = None):
         await message.edit(embed=embed)
         logging.error(f"Weather command error for {city}: {e}")
 
+def _build_weather_embed(current_data, city, author):
+    """Build the weather embed from an OpenWeatherMap payload"""
+    # Safely extract weather data with fallbacks
+    main = current_data.get('main', {})
+    weather_list = current_data.get('weather', [{}])
+    weather = weather_list[0] if weather_list else {}
+    wind = current_data.get('wind', {})
+    clouds = current_data.get('clouds', {})
+    sys_data = current_data.get('sys', {})
+    
+    # Create comprehensive weather embed with safe data extraction
+    embed = discord.Embed(
+        title=f"🌤️ Weather in {current_data.get('name', city)}, {sys_data.get('country', '')}",
+        description=f"**{weather.get('description', 'No description').title()}**",
+        color=_get_weather_color(weather.get('main', 'Clear')),
+        timestamp=datetime.now(timezone.utc)
+    )
+    
+    # Main weather info with safe extraction
+    temp = main.get('temp', 0)
+    feels_like = main.get('feels_like', temp)
+    temp_min = main.get('temp_min', temp)
+    temp_max = main.get('temp_max', temp)
+    humidity = main.get('humidity', 0)
+    pressure = main.get('pressure', 0)
+    
+    embed.add_field(
+        name="🌡️ Temperature",
+        value=f"**Current:** {temp:.1f}°C\n"
+              f"**Feels like:** {feels_like:.1f}°C\n"
+              f"**Min:** {temp_min:.1f}°C\n"
+              f"**Max:** {temp_max:.1f}°C",
+        inline=True
+    )
+    
+    embed.add_field(
+        name="💧 Humidity & Pressure",
+        value=f"**Humidity:** {humidity}%\n"
+              f"**Pressure:** {pressure} hPa\n"
+              f"**Visibility:** {current_data.get('visibility', 'N/A')}m",
+        inline=True
+    )
+    
+    # Wind and clouds with safe extraction
+    wind_speed = wind.get('speed', 0) * 3.6  # Convert m/s to km/h
+    wind_direction = _get_wind_direction(wind.get('deg', 0))
+    cloud_coverage = clouds.get('all', 0)
+    
+    embed.add_field(
+        name="💨 Wind & Clouds",
+        value=f"**Wind:** {wind_speed:.1f} km/h {wind_direction}\n"
+              f"**Clouds:** {cloud_coverage}%\n"
+              f"**Condition:** {weather.get('main', 'Unknown')}",
+        inline=True
+    )
+    
+    # Sunrise/sunset if available
+    if 'sunrise' in sys_data and 'sunset' in sys_data:
+        try:
+            sunrise = datetime.fromtimestamp(sys_data['sunrise']).strftime('%H:%M')
+            sunset = datetime.fromtimestamp(sys_data['sunset']).strftime('%H:%M')
+            embed.add_field(
+                name="🌅 Sun Times",
+                value=f"**Sunrise:** {sunrise}\n**Sunset:** {sunset}",
+                inline=True
+            )
+        except (ValueError, OSError) as e:
+            logging.warning(f"Error parsing sunrise/sunset times: {e}")
+    
+    # Weather icon
+    icon_code = weather.get('icon', '01d')  # Default sunny icon
+    icon_url = f"http://openweathermap.org/img/wn/{icon_code}@2x.png"
+    embed.set_thumbnail(url=icon_url)
+    
+    embed.set_footer(
+        text=f"Requested by {author.display_name} • Data from OpenWeatherMap",
+        icon_url=author.display_avatar.url if author.display_avatar else None
+    )
+    
+    return embed
+
 def _get_weather_color(condition):
     """Get color based on weather condition"""
     color_map = {
@@ -1904,28 +2260,6 @@ def _get_wind_direction(degrees):
     except (ValueError, TypeError):
         return "N/A"
 
-# Optional: Add a simple WeatherView if you want interactive buttons
-class WeatherView(discord.ui.View):
-    def __init__(self, author, city, weather_data):
-        super().__init__(timeout=300.0)
-        self.author = author
-        self.city = city
-        self.weather_data = weather_data
-    
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        return interaction.user == self.author
-    
-    @discord.ui.button(label="🔄 Refresh", style=discord.ButtonStyle.primary, emoji="🔄")
-    async def refresh_weather(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.send_message(f"🔄 Refreshing weather for {self.city}...", ephemeral=True)
-        # You could trigger a new weather fetch here
-    
-    @discord.ui.button(label="📍 Location", style=discord.ButtonStyle.secondary, emoji="📍")
-    async def show_location(self, interaction: discord.Interaction, button: discord.ui.Button):
-        coord = self.weather_data.get('coord', {})
-        lat = coord.get('lat', 'N/A')
-        lon = coord.get('lon', 'N/A')
-        await interaction.response.send_message(f"📍 **{self.city}**\nLatitude: {lat}\nLongitude: {lon}", ephemeral=True)    
 @weather.error
 async def weather_error(ctx, error):
     if isinstance(error, commands.MissingRequiredArgument):
@@ -1933,6 +2267,131 @@ async def weather_error(ctx, error):
     elif isinstance(error, commands.CommandOnCooldown):
         await ctx.send(f"⏳ Cooldown active. Try again in {error.retry_after:.1f}s")
 
+@bot.command(aliases=["wstats", "weather_cache"])
+@commands.has_permissions(administrator=True)
+async def weather_stats(ctx):
+    """Show weather cache and request coalescing counters"""
+    stats = weather_client.cache.stats()
+    embed = discord.Embed(
+        title="🌤️ Weather Cache Statistics",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="📊 Lookups",
+        value=f"**Hits:** {stats['hits']}\n"
+              f"**Misses:** {stats['misses']}\n"
+              f"**Hit rate:** {stats['hit_rate']:.0%}",
+        inline=True
+    )
+    embed.add_field(
+        name="🗃️ Entries",
+        value=f"**Cached cities:** {stats['entries']}/{weather_client.cache.max_entries}\n"
+              f"**Aliases:** {stats['aliases']}\n"
+              f"**Evicted:** {stats['evictions']} • **Expired:** {stats['expirations']}",
+        inline=True
+    )
+    embed.add_field(
+        name="🌐 Upstream",
+        value=f"**API calls:** {weather_client.upstream_calls}\n"
+              f"**Coalesced waiters:** {weather_client.coalesced}",
+        inline=True
+    )
+    embed.set_footer(text=f"Entries expire after {weather_client.cache.ttl:.0f}s • Each hit or coalesced waiter saves one API call")
+    await ctx.send(embed=embed)
+
+@bot.command(aliases=["arstats", "autoresponse_stats"])
+@commands.has_permissions(administrator=True)
+async def auto_response_stats(ctx):
+    """Show how many messages the auto-response fast path skipped"""
+    stats = keyword_matcher.stats()
+    embed = discord.Embed(
+        title="🎯 Auto-response Statistics",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="📨 Messages",
+        value=f"**Seen:** {stats['seen']:,}\n"
+              f"**Scanned:** {stats['scanned']:,}\n"
+              f"**Short-circuited:** {stats['short_circuited']:,}",
+        inline=True
+    )
+    embed.add_field(
+        name="⚡ Skipped because",
+        value=f"**Bot author:** {stats.get('skipped_bot', 0):,}\n"
+              f"**Empty:** {stats.get('skipped_empty', 0):,}\n"
+              f"**Too short:** {stats.get('skipped_too_short', 0):,}",
+        inline=True
+    )
+    capacity, per = auto_response_limiter.limit_for(ctx.channel.id)
+    embed.add_field(
+        name="🚦 Rate limit",
+        value=f"**Replies sent:** {auto_response_limiter.allowed:,}\n"
+              f"**Collapsed:** {auto_response_limiter.suppressed:,}\n"
+              f"**This channel:** {capacity} per {per:g}s",
+        inline=True
+    )
+    await ctx.send(embed=embed)
+
+@bot.command(aliases=["arlimit"])
+@commands.has_permissions(manage_channels=True)
+async def auto_response_limit(ctx, replies: str = None, seconds: float = 10.0):
+    """
+    Set the auto-response rate limit for this channel
+    Usage: !arlimit <replies> [seconds] | !arlimit off | !arlimit reset
+    """
+    if replies is None:
+        capacity, per = auto_response_limiter.limit_for(ctx.channel.id)
+        await ctx.send(f"🚦 Auto-responses in {ctx.channel.mention}: **{capacity}** per **{per:g}s**")
+        return
+
+    if replies.lower() == "reset":
+        auto_response_limiter.reset(ctx.channel.id)
+        capacity, per = auto_response_limiter.default
+        await ctx.send(f"🚦 Auto-responses in {ctx.channel.mention} reset to **{capacity}** per **{per:g}s**")
+        return
+
+    try:
+        capacity = 0 if replies.lower() == "off" else int(replies)
+    except ValueError:
+        await ctx.send("❌ Usage: `!arlimit <replies> [seconds]`, `!arlimit off` or `!arlimit reset`", delete_after=10)
+        return
+
+    if capacity < 0 or seconds <= 0:
+        await ctx.send("❌ Replies must be 0 or more and seconds greater than 0.", delete_after=10)
+        return
+
+    auto_response_limiter.configure(ctx.channel.id, capacity, seconds)
+    if capacity == 0:
+        await ctx.send(f"🔇 Auto-responses disabled in {ctx.channel.mention}")
+    else:
+        await ctx.send(f"🚦 Auto-responses in {ctx.channel.mention}: **{capacity}** per **{seconds:g}s**")
+    logging.info(f"Auto-response limit in {ctx.channel} set to {capacity}/{seconds}s by {ctx.author}")
+
+@bot.command(aliases=["jobs", "jobq"])
+@commands.has_permissions(administrator=True)
+async def job_status(ctx):
+    """Show the recent bulk jobs of this server and their checkpointed progress"""
+    jobs = job_queue.recent_jobs(ctx.guild.id)
+    embed = discord.Embed(
+        title="📋 Bulk Jobs",
+        description="Unfinished jobs resume automatically after a restart" if jobs else "No jobs recorded yet",
+        color=discord.Color.blue()
+    )
+    status_emojis = {"pending": "🕒", "running": "⏳", "done": "✅", "failed": "⚠️"}
+    for job in jobs:
+        progress = job_queue.progress(job["id"])
+        total = sum(progress.values())
+        embed.add_field(
+            name=f"{status_emojis.get(job['status'], '❔')} #{job['id']} {job['kind']}",
+            value=f"{job['description']}\n"
+                  f"✅ {progress['done']}/{total} done"
+                  + (f" • ❌ {progress['failed']} failed" if progress['failed'] else "")
+                  + (f" • 🕒 {progress['pending']} pending" if progress['pending'] else "")
+                  + f"\n<t:{int(job['created_at'])}:R>",
+            inline=False
+        )
+    await ctx.send(embed=embed)
+
 # =================================
 # STATUS COMMAND
 # =================================
@@ -1956,6 +2415,7 @@ async def set_status(ctx, *, text: str):
 @commands.has_permissions(manage_messages=True)
 async def delete_messages(ctx, amount: str = "5"):
     """Delete messages with interactive confirmation"""
+    reporter = None
     try:
         # Parse amount
         if amount == "-":
@@ -2022,6 +2482,11 @@ async def delete_messages(ctx, amount: str = "5"):
             color=discord.Color.orange()
         )
         await message.edit(embed=embed, view=None)
+        reporter = ProgressReporter(message, lambda deleted: discord.Embed(
+            title="🗑️ Deleting Messages...",
+            description=f"Deleting {action_desc}... ({deleted} deleted so far)",
+            color=discord.Color.orange()
+        ))
         
         # Store command message reference for deletion
         command_message = ctx.message
@@ -2034,29 +2499,29 @@ async def delete_messages(ctx, amount: str = "5"):
                 check=lambda m: not m.pinned and m.id != message.id
             )
         else:
-            # First, collect the specified number of messages (excluding confirmation message and command)
-            messages_to_delete = []
-            async for msg in ctx.channel.history(limit=amount_int + 100):  # Search a bit more to find enough
-                if msg.id != message.id and msg.id != command_message.id:  # Exclude confirmation and command
-                    messages_to_delete.append(msg)
-                    if len(messages_to_delete) >= amount_int:
-                        break
-            
-            # Add the command message separately
-            messages_to_delete.append(command_message)
+            # Stream the specified number of messages (excluding confirmation message and command)
+            # into bulk-delete batches; messages older than 14 days use paced single deletes
+            async with MessageDeleter(ctx.channel, reason=f"Message cleanup by {ctx.author}") as deleter:
+                found = 0
+                async for msg in ctx.channel.history(limit=amount_int + 100):  # Search a bit more to find enough
+                    if msg.id != message.id and msg.id != command_message.id:  # Exclude confirmation and command
+                        await deleter.add(msg)
+                        reporter.update(deleter.deleted)
+                        found += 1
+                        if found >= amount_int:
+                            break
+                
+                # Add the command message separately
+                await deleter.add(command_message)
             
-            # Delete the collected messages
-            deleted = []
-            for msg in messages_to_delete:
-                try:
-                    await msg.delete()
-                    deleted.append(msg)
-                except (discord.NotFound, discord.Forbidden):
-                    pass
+            logging.info(f"Message cleanup in {ctx.channel}: {deleter.bulk_requests} bulk + {deleter.single_requests} single delete requests")
         
         # Show result
         # Calculate actual messages deleted (excluding the command message for the count display)
-        actual_messages_deleted = len([msg for msg in deleted if msg.id != command_message.id])
+        if delete_all:
+            actual_messages_deleted = len([msg for msg in deleted if msg.id != command_message.id])
+        else:
+            actual_messages_deleted = max(0, deleter.deleted - 1)
         
         embed = discord.Embed(
             title="✅ Messages Deleted Successfully",
@@ -2066,7 +2531,7 @@ async def delete_messages(ctx, amount: str = "5"):
         )
         embed.set_footer(text=f"Deleted by {ctx.author.display_name}")
         
-        await message.edit(embed=embed, view=None)
+        await reporter.finish(embed=embed, view=None)
         await asyncio.sleep(5)
         await message.delete()
         
@@ -2078,14 +2543,20 @@ async def delete_messages(ctx, amount: str = "5"):
             description="I don't have permission to delete messages in this channel!",
             color=discord.Color.red()
         )
-        await ctx.send(embed=embed, delete_after=10)
+        if reporter and not reporter.finished:
+            await reporter.finish(embed=embed, view=None)
+        else:
+            await ctx.send(embed=embed, delete_after=10)
     except Exception as e:
         embed = discord.Embed(
             title="❌ Deletion Error",
             description=f"An error occurred while deleting messages: {str(e)}",
             color=discord.Color.red()
         )
-        await ctx.send(embed=embed, delete_after=10)
+        if reporter and not reporter.finished:
+            await reporter.finish(embed=embed, view=None)
+        else:
+            await ctx.send(embed=embed, delete_after=10)
         logging.error(f"Error deleting messages: {e}")
 @bot.command(aliases=["clearb", "clmb", "clsbot"])
 @commands.has_permissions(manage_messages=True)
@@ -2163,37 +2634,31 @@ async def delete_bot_messages(ctx, limit: str = "5"):
     )
     await message.edit(embed=embed, view=None)
     
+    reporter = None
     try:
         # Store command message reference
         command_message = ctx.message
         
-        if delete_all:
-            # Delete all bot messages in the channel
-            bot_messages_to_delete = []
-            async for msg in ctx.channel.history(limit=None):
-                if msg.author == bot.user and msg.id != message.id:
-                    bot_messages_to_delete.append(msg)
-        else:
-            # Search through messages to find this bot's messages (limited)
-            search_limit = min(limit_int * 5, 1000)  # Search up to 5x the limit or 1000 messages
-            bot_messages_to_delete = []
-            
+        # Stream matching messages straight into bulk-delete batches (constant memory,
+        # however long the history); messages older than 14 days use paced single deletes
+        search_limit = None if delete_all else min(limit_int * 5, 1000)  # Search up to 5x the limit or 1000 messages
+        found = 0
+        reporter = ProgressReporter(message, lambda deleted: discord.Embed(
+            title="🗑️ Deleting Bot Messages...",
+            description=f"{deleted} of this bot's messages deleted so far...",
+            color=discord.Color.orange()
+        ))
+        async with MessageDeleter(ctx.channel, reason=f"Bot message cleanup by {ctx.author}", own_messages=True) as deleter:
             async for msg in ctx.channel.history(limit=search_limit):
-                if len(bot_messages_to_delete) >= limit_int:
+                if not delete_all and found >= limit_int:
                     break
                 if msg.author == bot.user and msg.id != message.id:
-                    bot_messages_to_delete.append(msg)
+                    await deleter.add(msg)
+                    reporter.update(deleter.deleted)
+                    found += 1
         
-        # Delete the found bot messages
-        deleted_count = 0
-        for msg in bot_messages_to_delete:
-            try:
-                await msg.delete()
-                deleted_count += 1
-            except discord.NotFound:
-                pass  # Message already deleted
-            except discord.Forbidden:
-                logging.warning(f"No permission to delete message {msg.id}")
+        deleted_count = deleter.deleted
+        logging.info(f"Bot message cleanup in {ctx.channel}: {deleter.bulk_requests} bulk + {deleter.single_requests} single delete requests")
         
         # Delete the command message
         try:
@@ -2216,7 +2681,7 @@ async def delete_bot_messages(ctx, limit: str = "5"):
             inline=False
         )
         
-        await message.edit(embed=embed, view=None)
+        await reporter.finish(embed=embed, view=None)
         await asyncio.sleep(5)
         await message.delete()
         
@@ -2228,6 +2693,8 @@ async def delete_bot_messages(ctx, limit: str = "5"):
             description=f"Error occurred: {str(e)}",
             color=discord.Color.red()
         )
+        if reporter:
+            await reporter.cancel()  # A pending progress edit must not replace the error
         await message.edit(embed=embed, view=None)
         logging.error(f"Error in bot message deletion: {e}")
 
@@ -2259,6 +2726,7 @@ async def _show_main_help_menu(ctx):
                 ("h", "Show this comprehensive help menu"),
                 ("info", "Display detailed server statistics and information"),
                 ("w", "Get comprehensive weather data for any city worldwide"),
+                ("wstats", "Show weather cache hits, misses and API calls (Admin only)"),
                 ("status", "Change bot's activity status (Admin only)")
             ]
         },
@@ -2270,6 +2738,8 @@ async def _show_main_help_menu(ctx):
                 ("ch", "Create channel in specific category with confirmation"),
                 ("chi", "Interactive channel creation with category selection"),
                 ("cats", "Create multiple categories with privacy & role settings"),
+                ("bps", "List the category blueprints available to !cats --blueprint"),
+                ("jobs", "Show progress of resumable bulk jobs (Admin only)"),
                 ("modcat", "Add/remove role access from existing categories")
             ]
         },
@@ -2300,6 +2770,8 @@ async def _show_main_help_menu(ctx):
             "commands": [
                 ("Auto Greetings", "Responds to hello/hi/salam/ahlan automatically"),
                 ("Professor Quotes", "Responds to 'arawkan/ajihna' with random quotes"),
+                ("arstats", "Show auto-response skip and rate-limit counters (Admin only)"),
+                ("arlimit", "Set this channel's auto-response rate limit"),
             ]
         }
     }
@@ -2478,13 +2950,17 @@ async def _show_command_help(ctx, command_name):
             "examples": [
                 "!cats Math Physics Chemistry",
                 "!categories \"Computer Science\" Biology History",
-                "!cats Mathematics \"Data Science\" Literature"
+                "!cats Mathematics \"Data Science\" Literature",
+                "!cats --batch Math Physics Chemistry Biology",
+                "!cats --blueprint module Math Physics"
             ],
             "tips": [
-                "📁 Creates categories with 5 default channels: cours, tds, tps, exams, bonus",
+                "📁 Creates categories with the `default` blueprint channels (cours, tds, tps, exams, bonus)",
+                "📐 `--blueprint <name>` uses a layout from blueprints.json (see `!blueprints`)",
                 "🔒 Interactive privacy settings (public/private)",
                 "🎭 Role-based access control with multi-selection",
                 "✅ Confirmation prompts for safety",
+                "📦 `--batch` asks privacy/roles once for every listed category",
                 "💡 Use quotes for category names with spaces"
             ]
         },
@@ -2986,6 +3462,13 @@ class CategorySelectDropdown(discord.ui.Select):
 # ========================
 # CHANGE CATEGORY ACCESS
 # ========================
+async def _run_plan_job(ctx, kind, description, plan, reason=None, on_done=None):
+    """Persist a plan as a resumable job, run it, and pair each planned op with its error"""
+    job_id = job_queue.submit(kind, ctx.guild.id, ctx.channel.id, description, plan.payloads(),
+                              reason=reason, concurrency=plan.concurrency)
+    errors = await job_queue.run(job_id, on_done=on_done)
+    return list(zip(plan.ops, errors))
+
 @bot.command(aliases=["modcat", "modify_category"])
 @commands.has_permissions(administrator=True)
 async def modify_category_access(ctx, category_name: str, action: str = "add"):
@@ -2994,17 +3477,22 @@ async def modify_category_access(ctx, category_name: str, action: str = "add"):
     Usage: !modify_category_access <category_name> [add/remove]
     """
     guild = ctx.guild
-    category = discord.utils.get(guild.categories, name=category_name)
     
-    if not category:
-        await ctx.send(f"❌ Category `{category_name}` not found!", delete_after=5)
-        return
-    
-    # Vérifier l'action
+    # Vérifier l'action (avant toute question sur la catégorie)
     if action.lower() not in ["add", "remove"]:
         await ctx.send("❌ Action must be: `add` or `remove`", delete_after=5)
         return
     
+    names = name_index.get(guild)
+    category = names.category(category_name) or await _resolve_near_miss(
+        ctx, category_name, names.suggest(category_name), "Category"
+    )
+    
+    if not category:
+        await ctx.send(f"❌ Category `{category_name}` not found!", delete_after=5)
+        return
+    category_name = category.name
+    
     # Préparer les options de rôles avec filtrage
     all_roles = [role for role in guild.roles 
                 if role.name != "@everyone" and role < guild.me.top_role]
@@ -3030,7 +3518,7 @@ async def modify_category_access(ctx, category_name: str, action: str = "add"):
         role_options.append({
             'label': role.name,
             'value': str(role.id),
-            'description': f"Members: {len(role.members)}",
+            'description': f"Members: {guild_stats.role_count(role)}",
             'emoji': "🎭"
         })
 
@@ -3046,7 +3534,7 @@ async def modify_category_access(ctx, category_name: str, action: str = "add"):
         options=role_options,
         placeholder="Select roles...",
         min_values=1,
-        max_values=min(10, len(role_options)),
+        max_values=len(role_options),
         timeout=60.0
     )
     
@@ -3061,20 +3549,55 @@ async def modify_category_access(ctx, category_name: str, action: str = "add"):
     selected_roles = [guild.get_role(int(role_id)) for role_id in role_view.selected_values]
     selected_roles = [role for role in selected_roles if role]  # Filtrer les None
     
+    # Dry run: plan the exact overwrite writes from the gateway cache
+    plan = OverwritePlan()
+    for target in (category, *category.channels):
+        current = target.overwrites
+        
+        if action.lower() == "add":
+            everyone = current.get(guild.default_role)
+            if everyone is None or everyone.view_channel is not False:
+                plan.add(target, guild.default_role, discord.PermissionOverwrite(view_channel=False))
+            
+            for role in selected_roles:
+                if "guest" in role.name.lower() or "invite" in role.name.lower():
+                    overwrite = discord.PermissionOverwrite(
+                        view_channel=True,
+                        send_messages=False,
+                        add_reactions=False,
+                        create_public_threads=False,
+                        create_private_threads=False,
+                        send_messages_in_threads=False
+                    )
+                else:
+                    overwrite = discord.PermissionOverwrite(view_channel=True)
+                plan.set(target, role, overwrite, current)
+        else:
+            for role in selected_roles:
+                plan.set(target, role, None, current)
+    
     # Confirmation avec les nouvelles classes
     confirm_embed = discord.Embed(
         title=f"⚠️ Confirm Category Access Modification",
         description=f"**Category:** {category_name}\n**Action:** {action.title()}",
         color=discord.Color.orange()
     )
+    role_list = "\n".join(role.mention for role in selected_roles[:10])
+    if len(selected_roles) > 10:
+        role_list += f"\n... and {len(selected_roles) - 10} more"
     confirm_embed.add_field(
         name="🎭 Selected Roles:",
-        value="\n".join(role.mention for role in selected_roles),
+        value=role_list,
         inline=False
     )
     confirm_embed.add_field(
         name="📢 Affected Channels:",
-        value=f"{len(category.channels)} channels will be modified",
+        value=f"{len([t for t in plan.targets if t != category])} of {len(category.channels)} channels will be modified",
+        inline=False
+    )
+    confirm_embed.add_field(
+        name="🔧 Plan:",
+        value=plan.summary(),
         inline=False
     )
     
@@ -3088,74 +3611,22 @@ async def modify_category_access(ctx, category_name: str, action: str = "add"):
     
     # Appliquer les modifications
     try:
-        channels_modified = []
+        results = await _run_plan_job(
+            ctx, "modify_category_access", f"{action.title()} access on {category_name}", plan,
+            reason=f"modify_category_access by {ctx.author}"
+        )
+        
+        failed = [(op, error) for op, error in results if error is not None]
+        if failed and len(failed) == len(results) and all(isinstance(e, discord.Forbidden) for _, e in failed):
+            raise failed[0][1]
+        
+        failed_ids = {op.target.id for op, _ in failed}
+        channels_modified = [target.name for target in plan.targets
+                             if target != category and target.id not in failed_ids]
         
         if action.lower() == "add":
-            # Code d'ajout existant...
-            current_overwrites = category.overwrites
-            
-            if guild.default_role not in current_overwrites or current_overwrites[guild.default_role].view_channel is not False:
-                current_overwrites[guild.default_role] = discord.PermissionOverwrite(view_channel=False)
-            
-            for role in selected_roles:
-                if "guest" in role.name.lower() or "invite" in role.name.lower():
-                    current_overwrites[role] = discord.PermissionOverwrite(
-                        view_channel=True,
-                        send_messages=False,
-                        add_reactions=False,
-                        create_public_threads=False,
-                        create_private_threads=False,
-                        send_messages_in_threads=False
-                    )
-                else:
-                    current_overwrites[role] = discord.PermissionOverwrite(view_channel=True)
-
-            await category.edit(overwrites=current_overwrites)
-            
-            for channel in category.channels:
-                channel_overwrites = channel.overwrites.copy()
-                
-                if guild.default_role not in channel_overwrites or channel_overwrites[guild.default_role].view_channel is not False:
-                    channel_overwrites[guild.default_role] = discord.PermissionOverwrite(view_channel=False)
-                
-                for role in selected_roles:
-                    if "guest" in role.name.lower() or "invite" in role.name.lower():
-                        channel_overwrites[role] = discord.PermissionOverwrite(
-                            view_channel=True,
-                            send_messages=False,
-                            add_reactions=False,
-                            create_public_threads=False,
-                            create_private_threads=False,
-                            send_messages_in_threads=False
-                        )
-                    else:
-                        channel_overwrites[role] = discord.PermissionOverwrite(view_channel=True)
-
-                await channel.edit(overwrites=channel_overwrites)
-                channels_modified.append(channel.name)
-            
             action_text = f"Added access for {len(selected_roles)} roles"
-            
-        elif action.lower() == "remove":
-            # Code de suppression existant...
-            current_overwrites = category.overwrites.copy()
-            
-            for role in selected_roles:
-                if role in current_overwrites:
-                    del current_overwrites[role]
-            
-            await category.edit(overwrites=current_overwrites)
-            
-            for channel in category.channels:
-                channel_overwrites = channel.overwrites.copy()
-                
-                for role in selected_roles:
-                    if role in channel_overwrites:
-                        del channel_overwrites[role]
-                
-                await channel.edit(overwrites=channel_overwrites)
-                channels_modified.append(channel.name)
-            
+        else:
             action_text = f"Removed access for {len(selected_roles)} roles"
         
         # Message de confirmation final
@@ -3164,9 +3635,12 @@ async def modify_category_access(ctx, category_name: str, action: str = "add"):
             description=f"**Action:** {action_text}",
             color=discord.Color.green()
         )
+        role_list = "\n".join(role.mention for role in selected_roles[:10])
+        if len(selected_roles) > 10:
+            role_list += f"\n... and {len(selected_roles) - 10} more"
         embed.add_field(
             name="🎭 Roles affected:",
-            value="\n".join(role.mention for role in selected_roles),
+            value=role_list,
             inline=False
         )
         
@@ -3181,14 +3655,26 @@ async def modify_category_access(ctx, category_name: str, action: str = "add"):
                 inline=False
             )
         
-        current_roles = [role for role, overwrite in category.overwrites.items() 
+        # The gateway update may not have arrived yet; apply the executed plan to the cached map
+        category_overwrites = category.overwrites
+        for op, error in results:
+            if op.target == category and error is None:
+                if op.overwrite is None:
+                    category_overwrites.pop(op.subject, None)
+                else:
+                    category_overwrites[op.subject] = op.overwrite
+        
+        current_roles = [role for role, overwrite in category_overwrites.items() 
                         if isinstance(role, discord.Role) and role != guild.default_role 
                         and overwrite.view_channel is True]
         
         if current_roles:
+            access_list = "\n".join(role.mention for role in current_roles[:10])
+            if len(current_roles) > 10:
+                access_list += f"\n... and {len(current_roles) - 10} more"
             embed.add_field(
                 name="🔓 Current access:",
-                value="\n".join(role.mention for role in current_roles),
+                value=access_list,
                 inline=False
             )
         else:
@@ -3198,6 +3684,13 @@ async def modify_category_access(ctx, category_name: str, action: str = "add"):
                 inline=False
             )
         
+        if failed:
+            embed.add_field(
+                name=f"⚠️ Failed [{len(failed)}]:",
+                value="\n".join(f"• #{op.target.name}: {error}" for op, error in failed[:5]),
+                inline=False
+            )
+        
         await ctx.send(embed=embed)
         logging.info(f"🔧 Modified category '{category_name}' and {len(channels_modified)} channels access in {guild.name} by {ctx.author} - {action_text}")
         
@@ -3228,7 +3721,7 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
     guild = ctx.guild
     
     # Vérifier que le rôle existe
-    role = discord.utils.get(guild.roles, name=role_name)
+    role = name_index.get(guild).role(role_name)
     if not role:
         embed = discord.Embed(
             title="❌ Rôle non trouvé",
@@ -3249,25 +3742,25 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
         await ctx.send(embed=embed)
         return
     
-    # Préparer les options de catégories
-    category_options = []
-    for category in categories:
-        has_access = (role in category.overwrites and 
-                     category.overwrites[role].view_channel is True)
+    # Options construites page par page: seules les pages affichées lisent les overwrites
+    def category_option(category):
+        has_access = category.overwrites_for(role).view_channel is True
         
         emoji = "✅" if has_access else "📁"
         description = f"{len(category.channels)} canaux"
         if has_access:
             description += " (déjà accès)"
         
-        category_options.append({
+        return {
             'label': category.name,
             'value': str(category.id),
             'description': description,
             'emoji': emoji
-        })
+        }
+    
+    def category_page(page, size):
+        return [category_option(category) for category in categories[page * size:(page + 1) * size]]
     
-    # Utiliser SearchableSelectionView pour les grandes listes
     embed = discord.Embed(
         title=f"🎯 Sélection de catégories pour: {role_name}",
         description=f"**Rôle:** {role.mention}\n"
@@ -3279,25 +3772,15 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
         color=discord.Color.blue()
     )
     
-    # Choisir la vue appropriée selon le nombre de catégories
-    if len(categories) > 25:
-        view = SearchableSelectionView(
-            author=ctx.author,
-            options=category_options,
-            placeholder="Select categories or search...",
-            timeout=120.0,
-            min_values=1,
-            max_values=min(10, len(category_options))
-        )
-    else:
-        view = PaginatedSelectionView(
-            author=ctx.author,
-            options=category_options,
-            placeholder="Select categories...",
-            min_values=1,
-            max_values=min(10, len(category_options)),
-            timeout=120.0
-        )
+    view = PaginatedSelectionView(
+        author=ctx.author,
+        options=category_page,
+        total=len(categories),
+        placeholder="Select categories...",
+        min_values=1,
+        max_values=len(categories),
+        timeout=120.0
+    )
     
     selection_msg = await ctx.send(embed=embed, view=view)
     await view.wait()
@@ -3324,16 +3807,24 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
         total_channels += len(cat.channels)
         selected_text.append(f"📁 **{cat.name}** ({len(cat.channels)} canaux)")
     
+    if len(selected_text) > 10:
+        selected_text = selected_text[:10] + [f"... et {len(selected_text) - 10} autres"]
     final_confirm_embed.add_field(
         name="📋 Catégories qui seront modifiées:",
         value="\n".join(selected_text),
         inline=False
     )
     
+    # Dry run: only categories/channels whose overwrite for the role differs cost a request
+    plan = OverwritePlan.for_categories(
+        selected_categories, {role: discord.PermissionOverwrite(view_channel=True)}
+    )
+    
     final_confirm_embed.add_field(
         name="📊 Impact:",
         value=f"**{len(selected_categories)}** catégories\n"
-              f"**{total_channels}** canaux au total",
+              f"**{total_channels}** canaux au total\n"
+              f"🔧 **Plan:** {plan.summary()} ({plan.skipped} déjà à jour)",
         inline=False
     )
     
@@ -3346,6 +3837,7 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
         return
     
     # Appliquer les modifications
+    reporter = None
     try:
         await final_msg.edit(embed=discord.Embed(
             title="⏳ Application des modifications...",
@@ -3353,43 +3845,43 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
             color=discord.Color.yellow()
         ), view=None)
         
-        success_count = 0
+        reporter = ProgressReporter(final_msg, lambda finished: discord.Embed(
+            title="⏳ Traitement en cours...",
+            description=f"🔧 **{finished}/{len(plan)}** permissions mises à jour",
+            color=discord.Color.yellow()
+        ))
+        
+        async def on_done(finished):
+            reporter.update(finished)
+        
+        results = await _run_plan_job(
+            ctx, "add_guest", f"Add {role_name} to {len(selected_categories)} categories", plan,
+            reason=f"add_guest_selective by {ctx.author}", on_done=on_done
+        )
+        
         error_count = 0
         processed_channels = 0
         errors = []
+        failed_categories = set()
+        for op, error in results:
+            target = op.target
+            is_category = isinstance(target, discord.CategoryChannel)
+            if error is None:
+                if not is_category:
+                    processed_channels += 1
+                continue
+            error_count += 1
+            if is_category:
+                failed_categories.add(target.id)
+                errors.append(f"Catégorie {target.name}: {str(error)}")
+                logging.error(f"❌ Failed to add {role_name} to category '{target.name}': {str(error)}")
+            else:
+                errors.append(f"Canal {target.name}: {str(error)}")
         
-        for i, category in enumerate(selected_categories):
-            try:
-                if i % 3 == 0:
-                    progress_embed = discord.Embed(
-                        title="⏳ Traitement en cours...",
-                        description=f"📁 **{category.name}** ({i+1}/{len(selected_categories)})",
-                        color=discord.Color.yellow()
-                    )
-                    await final_msg.edit(embed=progress_embed)
-                
-                current_overwrites = category.overwrites.copy()
-                current_overwrites[role] = discord.PermissionOverwrite(view_channel=True)
-                await category.edit(overwrites=current_overwrites)
-                
-                for channel in category.channels:
-                    try:
-                        channel_overwrites = channel.overwrites.copy()
-                        channel_overwrites[role] = discord.PermissionOverwrite(view_channel=True)
-                        await channel.edit(overwrites=channel_overwrites)
-                        processed_channels += 1
-                    except discord.HTTPException as e:
-                        errors.append(f"Canal {channel.name}: {str(e)}")
-                        error_count += 1
-                
-                success_count += 1
+        success_count = len(selected_categories) - len(failed_categories)
+        for category in selected_categories:
+            if category.id not in failed_categories:
                 logging.info(f"✅ Added {role_name} to selected category '{category.name}'")
-                await asyncio.sleep(0.5)
-                
-            except discord.HTTPException as e:
-                error_count += 1
-                errors.append(f"Catégorie {category.name}: {str(e)}")
-                logging.error(f"❌ Failed to add {role_name} to category '{category.name}': {str(e)}")
         
         # Message de résultat final
         if success_count > 0:
@@ -3403,13 +3895,14 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
                 value=f"```"
                       f"✅ Catégories modifiées: {success_count}/{len(selected_categories)}\n"
                       f"📢 Canaux modifiés: {processed_channels}\n"
+                      f"⏭️ Déjà à jour (ignorés): {plan.skipped}\n"
                       f"❌ Erreurs: {error_count}\n"
                       f"🎭 Rôle ajouté: {role_name}"
                       f"```",
                 inline=False
             )
             
-            success_categories = [cat.name for cat in selected_categories]
+            success_categories = [cat.name for cat in selected_categories if cat.id not in failed_categories]
             if len(success_categories) <= 10:
                 result_embed.add_field(
                     name="📁 Catégories modifiées:",
@@ -3436,7 +3929,7 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
                 color=discord.Color.red()
             )
         
-        await final_msg.edit(embed=result_embed)
+        await reporter.finish(embed=result_embed)
         
         await asyncio.sleep(3)
         try:
@@ -3452,7 +3945,10 @@ async def add_guest_selective(ctx, role_name: str = "Guest"):
             description=f"```{str(e)}```",
             color=discord.Color.red()
         )
-        await ctx.send(embed=embed)
+        if reporter and not reporter.finished:
+            await reporter.finish(embed=embed)
+        else:
+            await ctx.send(embed=embed)
         logging.error(f"Selective role addition error: {str(e)}")
 
 @bot.command(aliases=["rmguest", "rmgu"])
@@ -3465,7 +3961,7 @@ async def remove_guest_selective(ctx, role_name: str = "Guest"):
     guild = ctx.guild
     
     # Vérifier que le rôle existe
-    role = discord.utils.get(guild.roles, name=role_name)
+    role = name_index.get(guild).role(role_name)
     if not role:
         embed = discord.Embed(
             title="❌ Rôle non trouvé",
@@ -3545,11 +4041,8 @@ async def remove_guest_selective(ctx, role_name: str = "Guest"):
         return
     
     # Récupérer les catégories sélectionnées
-    selected_categories = [
-        discord.utils.get(guild.categories, id=int(value))
-        for value in view.selected_values
-    ]
-    selected_categories = [cat for cat in selected_categories if cat]  # Filtrer les None
+    selected_categories = [guild.get_channel(int(value)) for value in view.selected_values]
+    selected_categories = [cat for cat in selected_categories if isinstance(cat, discord.CategoryChannel)]
     
     if not selected_categories:
         await ctx.send("⚠️ Aucune catégorie sélectionnée.", delete_after=5)
@@ -3574,16 +4067,24 @@ async def remove_guest_selective(ctx, role_name: str = "Guest"):
         total_channels += len(cat.channels)
         selected_text.append(f"🔒 **{cat.name}** ({len(cat.channels)} canaux)")
     
+    if len(selected_text) > 10:
+        selected_text = selected_text[:10] + [f"... et {len(selected_text) - 10} autres"]
     final_confirm_embed.add_field(
         name="📋 Catégories qui perdront l'accès:",
         value="\n".join(selected_text),
         inline=False
     )
     
+    # Dry run: only the objects that actually carry an overwrite for the role need a request
+    plan = OverwritePlan.for_categories(selected_categories, {role: None})
+    planned_categories = sum(isinstance(target, discord.CategoryChannel) for target in plan.targets)
+    
     final_confirm_embed.add_field(
         name="📊 Impact:",
         value=f"**{len(selected_categories)}** catégories\n"
               f"**{total_channels}** canaux au total\n"
+              f"🔧 **Plan:** {plan.summary()} "
+              f"({planned_categories} catégories, {len(plan) - planned_categories} canaux)\n"
               f"⚠️ **ATTENTION:** L'accès sera complètement retiré!",
         inline=False
     )
@@ -3615,57 +4116,52 @@ async def remove_guest_selective(ctx, role_name: str = "Guest"):
         return
     
     # Appliquer les modifications
+    reporter = None
     try:
         await final_msg.edit(embed=discord.Embed(
             title="⏳ Retrait des accès en cours...",
-            description=f"Traitement de {len(selected_categories)} catégories...",
+            description=f"Traitement de {len(selected_categories)} catégories ({len(plan)} requêtes)...",
             color=discord.Color.yellow()
         ), view=None)
         
-        success_count = 0
+        reporter = ProgressReporter(final_msg, lambda finished: discord.Embed(
+            title="⏳ Retrait en cours...",
+            description=f"🔒 **{finished}/{len(plan)}** permissions retirées",
+            color=discord.Color.yellow()
+        ))
+        
+        async def on_done(finished):
+            reporter.update(finished)
+        
+        # Per-overwrite DELETE for exactly the planned objects
+        results = await _run_plan_job(
+            ctx, "remove_guest", f"Remove {role_name} from {len(selected_categories)} categories", plan,
+            reason=f"remove_guest_selective by {ctx.author}", on_done=on_done
+        )
+        
         error_count = 0
         processed_channels = 0
         errors = []
+        failed_categories = set()
+        for op, error in results:
+            target = op.target
+            is_category = isinstance(target, discord.CategoryChannel)
+            if error is None:
+                if not is_category:
+                    processed_channels += 1
+                continue
+            error_count += 1
+            if is_category:
+                failed_categories.add(target.id)
+                errors.append(f"Catégorie {target.name}: {str(error)}")
+                logging.error(f"❌ Failed to remove {role_name} from category '{target.name}': {str(error)}")
+            else:
+                errors.append(f"Canal {target.name}: {str(error)}")
         
-        for i, category in enumerate(selected_categories):
-            try:
-                # Mise à jour du statut
-                if i % 3 == 0:
-                    progress_embed = discord.Embed(
-                        title="⏳ Retrait en cours...",
-                        description=f"🔒 **{category.name}** ({i+1}/{len(selected_categories)})",
-                        color=discord.Color.yellow()
-                    )
-                    await final_msg.edit(embed=progress_embed)
-                
-                # Retirer le rôle de la catégorie
-                current_overwrites = category.overwrites.copy()
-                if role in current_overwrites:
-                    del current_overwrites[role]
-                    await category.edit(overwrites=current_overwrites)
-                
-                # Retirer le rôle de tous les canaux de la catégorie
-                for channel in category.channels:
-                    try:
-                        channel_overwrites = channel.overwrites.copy()
-                        if role in channel_overwrites:
-                            del channel_overwrites[role]
-                            await channel.edit(overwrites=channel_overwrites)
-                        processed_channels += 1
-                    except discord.HTTPException as e:
-                        errors.append(f"Canal {channel.name}: {str(e)}")
-                        error_count += 1
-                
-                success_count += 1
+        success_count = len(selected_categories) - len(failed_categories)
+        for category in selected_categories:
+            if category.id not in failed_categories:
                 logging.info(f"🔒 Removed {role_name} from category '{category.name}'")
-                
-                # Délai pour éviter le rate limiting
-                await asyncio.sleep(0.5)
-                
-            except discord.HTTPException as e:
-                error_count += 1
-                errors.append(f"Catégorie {category.name}: {str(e)}")
-                logging.error(f"❌ Failed to remove {role_name} from category '{category.name}': {str(e)}")
         
         # Message de résultat final
         if success_count > 0:
@@ -3686,7 +4182,7 @@ async def remove_guest_selective(ctx, role_name: str = "Guest"):
             )
             
             # Lister les catégories modifiées avec succès
-            success_categories = [cat.name for cat in selected_categories]
+            success_categories = [cat.name for cat in selected_categories if cat.id not in failed_categories]
             if len(success_categories) <= 10:
                 result_embed.add_field(
                     name="🔒 Accès retiré de:",
@@ -3713,7 +4209,7 @@ async def remove_guest_selective(ctx, role_name: str = "Guest"):
                 color=discord.Color.red()
             )
         
-        await final_msg.edit(embed=result_embed)
+        await reporter.finish(embed=result_embed)
         
         # Supprimer le message de sélection après un délai
         try:
@@ -3729,7 +4225,10 @@ async def remove_guest_selective(ctx, role_name: str = "Guest"):
             description=f"```{str(e)}```",
             color=discord.Color.red()
         )
-        await ctx.send(embed=embed)
+        if reporter and not reporter.finished:
+            await reporter.finish(embed=embed)
+        else:
+            await ctx.send(embed=embed)
         logging.error(f"Selective role removal error: {str(e)}")
 
 # ========================
@@ -0,0 +1,139 @@
+import math
+from collections import Counter
+from typing import Optional, Dict, List, Union, Sequence, Any
+
+import discord
+
+from job_queue import overwrite_op
+
+# ========================
+# RATE-LIMIT ESTIMATES
+# ========================
+
+# Typical REST round-trip to Discord, seconds
+REQUEST_LATENCY = 0.3
+# Global limit shared by every route: (requests, seconds)
+GLOBAL_LIMIT = (50, 1.0)
+# Overwrite PUT/DELETE share one bucket per channel (the route's major
+# parameter). Discord does not publish per-route limits; this is what the
+# X-RateLimit headers have reported, and it only bounds the estimate.
+OVERWRITE_BUCKET = (5, 5.0)
+
+# ========================
+# PERMISSION OVERWRITE PLANS
+# ========================
+
+PermissionTarget = Union[discord.Role, discord.Member]
+
+class OverwriteOp:
+    """One REST call: set (PUT) or delete (DELETE) a single overwrite on a channel"""
+
+    __slots__ = ("target", "subject", "overwrite")
+
+    def __init__(self, target: discord.abc.GuildChannel, subject: PermissionTarget,
+                 overwrite: Optional[discord.PermissionOverwrite]):
+        self.target = target
+        self.subject = subject
+        self.overwrite = overwrite
+
+    @property
+    def method(self) -> str:
+        return "DELETE" if self.overwrite is None else "PUT"
+
+    def __repr__(self) -> str:
+        return f"<OverwriteOp {self.method} #{self.target.name} {self.subject.name}>"
+
+class OverwritePlan:
+    """
+    Dry-run plan of permission changes as concrete per-overwrite REST calls.
+
+    Commands build the plan from the gateway cache before asking for
+    confirmation, show ``summary()`` in the confirmation embed, then run the
+    very same plan as a resumable job through ``payloads()``; nothing is
+    recomputed afterwards.
+    """
+
+    def __init__(self, concurrency: int = 5):
+        self.concurrency = concurrency
+        self.ops: List[OverwriteOp] = []
+        self.checked = 0
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def add(self, target: discord.abc.GuildChannel, subject: PermissionTarget,
+            overwrite: Optional[discord.PermissionOverwrite]):
+        """Plan a write unconditionally"""
+        self.ops.append(OverwriteOp(target, subject, overwrite))
+
+    def set(self, target: discord.abc.GuildChannel, subject: PermissionTarget,
+            overwrite: Optional[discord.PermissionOverwrite],
+            current: Optional[Dict[Any, discord.PermissionOverwrite]] = None) -> bool:
+        """
+        Plan a write only when the target's overwrite for ``subject`` differs
+        from ``overwrite`` (None meaning no overwrite). ``current`` lets callers
+        pass an already-built ``target.overwrites`` map. Returns True if planned.
+        """
+        self.checked += 1
+        if current is None:
+            current = target.overwrites
+        if current.get(subject) == overwrite:
+            return False
+        self.add(target, subject, overwrite)
+        return True
+
+    @classmethod
+    def for_categories(cls, categories: Sequence[discord.CategoryChannel],
+                       changes: Dict[PermissionTarget, Optional[discord.PermissionOverwrite]],
+                       concurrency: int = 5) -> "OverwritePlan":
+        """
+        Plan ``changes`` on every category and all of its channels.
+
+        Each category comes right before its channels. Objects that already
+        carry the wanted overwrite, synced with their category or not, are left
+        out, so only objects that actually change cost a request.
+        """
+        plan = cls(concurrency)
+        for category in categories:
+            for target in (category, *category.channels):
+                current = target.overwrites
+                for subject, overwrite in changes.items():
+                    plan.set(target, subject, overwrite, current)
+        return plan
+
+    @property
+    def targets(self) -> List[discord.abc.GuildChannel]:
+        """Distinct channels touched by the plan, in plan order"""
+        return list({op.target.id: op.target for op in self.ops}.values())
+
+    @property
+    def skipped(self) -> int:
+        """Checked overwrites already in the wanted state"""
+        return self.checked - len(self.ops)
+
+    def estimate(self) -> float:
+        """
+        Wall-clock estimate in seconds: the slowest of the concurrency-bound
+        round-trips, the global limit and the busiest per-channel bucket.
+        """
+        if not self.ops:
+            return 0.0
+
+        count = len(self.ops)
+        eta = math.ceil(count / self.concurrency) * REQUEST_LATENCY
+
+        limit, per = GLOBAL_LIMIT
+        eta = max(eta, (count - 1) // limit * per + REQUEST_LATENCY)
+
+        limit, per = OVERWRITE_BUCKET
+        busiest = max(Counter(op.target.id for op in self.ops).values())
+        return max(eta, (busiest - 1) // limit * per + REQUEST_LATENCY)
+
+    def summary(self) -> str:
+        """Short "N requests, ~T seconds" line for confirmation embeds"""
+        count = len(self.ops)
+        return f"{count} request{'s' if count != 1 else ''}, ~{math.ceil(self.estimate())} seconds"
+
+    def payloads(self) -> List[Dict[str, Any]]:
+        """The plan as persistable job-queue operations, in plan order"""
+        return [overwrite_op(op.target, op.subject, op.overwrite) for op in self.ops]
@@ -0,0 +1,186 @@
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple, Any, Sequence, Collection
+
+# ========================
+# TEXT NORMALIZATION
+# ========================
+
+# Fuzzy candidates sharing less than this Dice share of trigrams are dropped
+FUZZY_MIN_SCORE = 0.3
+
+SEPARATORS = re.compile(r"[\s\-_]+")
+NON_WORD = re.compile(r"[^\w]+|_")
+
+def fuzzy_key(name: str) -> str:
+    """Accent-free, case-folded name with separators (spaces, -, _) collapsed"""
+    if not name.isascii():
+        name = "".join(c for c in unicodedata.normalize("NFKD", name) if not unicodedata.combining(c))
+    return " ".join(SEPARATORS.split(name.casefold())).strip()
+
+@lru_cache(maxsize=65536)
+def trigrams(key: str) -> frozenset:
+    padded = f"  {key} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+def dice(a: frozenset, b: frozenset, shared: int) -> float:
+    return 2 * shared / (len(a) + len(b))
+
+def fuzzy_matches(query: frozenset, postings: Dict[str, Collection[str]],
+                  min_score: float = FUZZY_MIN_SCORE) -> Dict[str, float]:
+    """
+    Keys of ``postings`` (trigram -> keys) whose Dice similarity with the
+    ``query`` trigrams reaches ``min_score``.
+
+    A match must share at least ``min_score * |query| / (2 - min_score)``
+    trigrams with the query, so candidates are only gathered from the rarest
+    trigrams (all but that many minus one) and then verified against their
+    own trigram set: the most common trigrams' long posting lists are never
+    walked.
+    """
+    if not query:
+        return {}
+    need = max(1, math.ceil(min_score * len(query) / (2 - min_score)))
+    grams = sorted(query, key=lambda gram: len(postings.get(gram, ())))
+    candidates = set()
+    for gram in grams[:len(grams) - need + 1]:
+        candidates.update(postings.get(gram, ()))
+
+    matches = {}
+    for candidate in candidates:
+        other = trigrams(candidate)
+        score = dice(query, other, len(query & other))
+        if score >= min_score:
+            matches[candidate] = score
+    return matches
+
+def words(key: str) -> List[str]:
+    """Words of a ``fuzzy_key`` (punctuation splits words)"""
+    return [word for word in NON_WORD.split(key) if word]
+
+def tokenize(text: str) -> List[str]:
+    """Accent-free, case-folded words of ``text``"""
+    return words(fuzzy_key(text))
+
+# ========================
+# RANKED OPTION SEARCH
+# ========================
+
+# Typo matches in option search must be closer than name suggestions
+SEARCH_MIN_SCORE = 0.5
+# Per query-token match weights: whole token, token prefix, fuzzy (times Dice)
+EXACT_WEIGHT = 3.0
+PREFIX_WEIGHT = 2.0
+FUZZY_WEIGHT = 1.0
+# Matches in descriptions count for less than matches in labels
+DESCRIPTION_FACTOR = 0.5
+# Bonus when the whole label equals / starts with the whole query
+LABEL_EXACT_BONUS = 4.0
+LABEL_PREFIX_BONUS = 2.0
+
+class SearchIndex:
+    """
+    Inverted index over selection options, built once per view.
+
+    Labels and descriptions are split into accent-free, case-folded tokens.
+    Each query token is matched against the sorted token list by prefix
+    (bisect) and, when no token starts with it, against a trigram index for
+    typos, so a search only touches the postings of matching tokens,
+    never the whole option list. Options are
+    ranked by the number of query tokens they match, then by score; ties keep
+    the original option order.
+    """
+
+    def __init__(self, options: Sequence[Any]):
+        self.options = options
+        self.labels: List[str] = []
+        # token -> [(option index, weight factor)]
+        self.postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+
+        for i, option in enumerate(options):
+            if isinstance(option, dict):
+                label, description = option.get('label', ''), option.get('description') or ''
+            else:
+                label, description = str(option), ''
+            key = fuzzy_key(label)
+            self.labels.append(key)
+
+            seen = set()
+            for token in words(key):
+                if token not in seen:
+                    seen.add(token)
+                    self.postings[token].append((i, 1.0))
+            for token in (tokenize(description) if description else ()):
+                if token not in seen:
+                    seen.add(token)
+                    self.postings[token].append((i, DESCRIPTION_FACTOR))
+
+        self.tokens = sorted(self.postings)
+        self._grams: Optional[Dict[str, List[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    @property
+    def grams(self) -> Dict[str, List[str]]:
+        """Trigram -> tokens, built on the first search that needs typo matching"""
+        if self._grams is None:
+            self._grams = defaultdict(list)
+            for token in self.tokens:
+                for gram in trigrams(token):
+                    self._grams[gram].append(token)
+        return self._grams
+
+    def _prefixed(self, prefix: str) -> List[str]:
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\U0010ffff", start)
+        return self.tokens[start:end]
+
+    def _token_scores(self, token: str) -> Dict[int, float]:
+        """Best score per option for one query token; typo matching only when nothing starts with it"""
+        scores: Dict[int, float] = {}
+
+        def offer(candidate: str, weight: float):
+            for i, factor in self.postings[candidate]:
+                score = weight * factor
+                if score > scores.get(i, 0.0):
+                    scores[i] = score
+
+        for candidate in self._prefixed(token):
+            offer(candidate, EXACT_WEIGHT if candidate == token else PREFIX_WEIGHT)
+        if not scores:
+            for candidate, similarity in fuzzy_matches(trigrams(token), self.grams, SEARCH_MIN_SCORE).items():
+                offer(candidate, FUZZY_WEIGHT * similarity)
+        return scores
+
+    def search(self, query: str, limit: int = 20) -> Tuple[List[Any], int]:
+        """
+        Best ``limit`` options for ``query`` and the total number of matches.
+
+        An empty query returns the first ``limit`` options unranked.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return list(self.options[:limit]), len(self.options)
+
+        matched: Dict[int, int] = defaultdict(int)
+        totals: Dict[int, float] = defaultdict(float)
+        for token in tokens:
+            for i, score in self._token_scores(token).items():
+                matched[i] += 1
+                totals[i] += score
+
+        whole = fuzzy_key(query)
+        for i in totals:
+            if self.labels[i] == whole:
+                totals[i] += LABEL_EXACT_BONUS
+            elif self.labels[i].startswith(whole):
+                totals[i] += LABEL_PREFIX_BONUS
+
+        best = heapq.nsmallest(limit, totals, key=lambda i: (-matched[i], -totals[i], i))
+        return [self.options[i] for i in best], len(totals)
@@ -1,14 +1,18 @@
+import asyncio
+import inspect
+import logging
+import aiohttp
 import discord
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Union, Iterable, AsyncIterator
 import math
 from datetime import datetime, timezone
 
+from search_index import SearchIndex
+
 # ========================
 # REUSABLE BUTTON CLASSES
 # ========================
 
-ctx = ""
-
 class ConfirmationView(discord.ui.View):
     """Standard confirmation view with Confirm/Cancel buttons"""
 
@@ -340,16 +344,220 @@ class SelectionView(discord.ui.View):
         await interaction.response.defer()
         self.stop()
 
+# ========================
+# PROGRESS REPORTING
+# ========================
+
+class ProgressReporter:
+    """
+    Throttled progress display for bulk jobs.
+
+    Work items call ``update(state)`` as often as they like: it only records
+    the latest state, and a background edit renders it onto ``message`` at
+    most once every ``interval`` seconds. ``finish()`` flushes the final
+    embed, so a job costs about duration / interval + 1 edits no matter how
+    many items it has. Callers that edit the message themselves (error paths)
+    call ``cancel()`` first so a late update cannot overwrite them.
+    """
+
+    def __init__(self,
+                 message: discord.Message,
+                 render: Callable[[Any], discord.Embed],
+                 interval: float = 2.0):
+        self.message = message
+        self.render = render
+        self.interval = interval
+        self.edits = 0
+
+        self._state: Any = None
+        self._dirty = False
+        self._editing = False
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.finished = False
+        # The message was just sent or edited by the caller
+        self._last_edit = asyncio.get_running_loop().time()
+
+    def update(self, state: Any = None):
+        """Record the latest state; the display catches up within ``interval`` seconds"""
+        if self._closed:
+            return
+        self._state = state
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        loop = asyncio.get_running_loop()
+        while self._dirty:
+            delay = self._last_edit + self.interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._dirty = False
+            self._editing = True
+            try:
+                await self._edit(embed=self.render(self._state))
+            finally:
+                self._editing = False
+
+    async def _edit(self, **kwargs):
+        self._last_edit = asyncio.get_running_loop().time()
+        self.edits += 1
+        try:
+            await self.message.edit(**kwargs)
+        except discord.HTTPException as e:
+            logging.warning(f"⚠️ Progress update failed: {e}")
+
+    async def cancel(self):
+        """Drop any pending update, wait out an edit in flight and ignore later updates"""
+        self._closed = True
+        self._dirty = False
+        if self._task and not self._task.done():
+            if self._editing:
+                await self._task
+            else:
+                self._task.cancel()
+
+    async def finish(self, embed: Optional[discord.Embed] = None, **kwargs):
+        """Drop any pending update and show the final state (``embed`` or the last rendered one)"""
+        await self.cancel()
+        self.finished = True
+        await self._edit(embed=embed if embed is not None else self.render(self._state), **kwargs)
+
 # ========================
 # CUSTOM VIEWS
 # ========================
 
+class OptionPages:
+    """
+    Page source for ``PaginatedSelectionView``, materializing options one page
+    at a time and caching every page already built.
+
+    ``source`` may be:
+    - a list of options, sliced per page;
+    - a callable ``(page, page_size) -> options`` (plain or async), with
+      ``total`` giving the number of options when known (otherwise the page
+      after each full page is fetched too, so a last page is never empty);
+    - an iterable or async iterator of options, consumed only as far as the
+      pages requested so far (plus one option, to know if another page exists).
+    """
+
+    def __init__(self,
+                 source: Union[List[Any], Callable, Iterable, AsyncIterator],
+                 page_size: int,
+                 total: Optional[int] = None):
+        self.page_size = page_size
+        self.pages: Dict[int, List[Any]] = {}
+        self._fetch: Optional[Callable] = None
+        self._iterator = None
+        self._lookahead: List[Any] = []
+        self._exhausted = False
+        self._end = 0  # Page count, once exhausted
+
+        if isinstance(source, list):
+            total = len(source)
+            self._fetch = lambda page, size: source[page * size:(page + 1) * size]
+        elif callable(source):
+            self._fetch = source
+        elif hasattr(source, "__aiter__"):
+            self._iterator = source.__aiter__()
+        else:
+            self._iterator = iter(source)
+        self.total = total
+
+    @property
+    def is_async(self) -> bool:
+        """True when pages can only be built with ``await load()``"""
+        if self._iterator is not None:
+            return hasattr(self._iterator, "__anext__")
+        return inspect.iscoroutinefunction(self._fetch)
+
+    @property
+    def total_pages(self) -> Optional[int]:
+        """Page count, or None while an iterator has not been exhausted"""
+        if self.total is not None:
+            return max(1, math.ceil(self.total / self.page_size))
+        if self._exhausted:
+            return max(1, self._end)
+        return None
+
+    def has_page(self, page: int) -> bool:
+        total_pages = self.total_pages
+        return page < total_pages if total_pages is not None else page <= len(self.pages)
+
+    def _store(self, page: int, options: List[Any]):
+        if options or page == 0:
+            self.pages[page] = options
+        # A short page ends a source of unknown length; an iterator ends when
+        # nothing was read past this page
+        if len(options) < self.page_size or (self._iterator is not None and not self._lookahead):
+            self._exhausted = True
+            self._end = page + 1 if options or page == 0 else page
+
+    def _peeks(self, page: int) -> bool:
+        """True when a callable of unknown length must be probed past full ``page``"""
+        return (self.total is None and not self._exhausted
+                and page in self.pages and page + 1 not in self.pages)
+
+    def _take(self, option: Any, options: List[Any]) -> bool:
+        """Add an iterated option to the page being built; False once the page is full"""
+        if len(options) == self.page_size:
+            self._lookahead = [option]
+            return False
+        options.append(option)
+        return True
+
+    def get(self, page: int) -> List[Any]:
+        """Options of ``page`` from a synchronous source"""
+        if self._iterator is not None:
+            while len(self.pages) <= page and not self._exhausted:
+                options, self._lookahead = self._lookahead, []
+                for option in self._iterator:
+                    if not self._take(option, options):
+                        break
+                self._store(len(self.pages), options)
+        else:
+            if page not in self.pages:
+                self._store(page, list(self._fetch(page, self.page_size)))
+            if self._peeks(page) and not self.is_async:
+                self._store(page + 1, list(self._fetch(page + 1, self.page_size)))
+        return self.pages.get(page, [])
+
+    async def load(self, page: int) -> List[Any]:
+        """Options of ``page`` from any source"""
+        if not self.is_async:
+            return self.get(page)
+        if self._iterator is not None:
+            while len(self.pages) <= page and not self._exhausted:
+                options, self._lookahead = self._lookahead, []
+                async for option in self._iterator:
+                    if not self._take(option, options):
+                        break
+                self._store(len(self.pages), options)
+        else:
+            if page not in self.pages:
+                self._store(page, list(await self._fetch(page, self.page_size)))
+            if self._peeks(page):
+                self._store(page + 1, list(await self._fetch(page + 1, self.page_size)))
+        return self.pages.get(page, [])
+
 class PaginatedSelectionView(discord.ui.View):
-    """Selection view with pagination for handling large lists of options"""
+    """
+    Selection view with pagination for handling large lists of options.
+
+    ``options`` is a list or any ``OptionPages`` source (callable, iterable,
+    async iterator): only the pages actually shown are built. With an async
+    source, ``await view.load()`` before sending the view.
+
+    The selection is one set for the whole list: it survives page changes,
+    each page's menu only adds or removes its own options, and with
+    ``max_values > 1`` "select page", "select all" and "clear" shortcuts act
+    on it, up to ``max_values`` options.
+    """
 
     def __init__(self,
                  author: discord.Member,
-                 options: List[Dict[str, Any]],
+                 options: Union[List[Dict[str, Any]], Callable, Iterable, AsyncIterator],
                  placeholder: str = "Select an option...",
                  min_values: int = 1,
                  max_values: int = 1,
@@ -357,15 +565,17 @@ class PaginatedSelectionView(discord.ui.View):
                  auto_confirm: bool = False,
                  show_back_button: bool = False,
                  back_callback: Optional[Callable] = None,
-                 items_per_page: int = 20):  # Max 20 pour laisser place aux options spéciales
+                 items_per_page: int = 20,  # Max 20 pour laisser place aux options spéciales
+                 total: Optional[int] = None):
         super().__init__(timeout=timeout)
         self.author = author
-        self.selected_values = []
+        self.selected: Dict[str, None] = {}  # Ordered set of selected values, across pages
         self.confirmed: Optional[bool] = None
         self.placeholder = placeholder
         self.min_values = min_values
         self.max_values = max_values
-        self.all_options = options
+        self.pages = OptionPages(options, items_per_page, total)
+        self.all_options = options if isinstance(options, list) else None
         self.auto_confirm = auto_confirm
         self.show_back_button = show_back_button
         self.back_callback = back_callback
@@ -373,21 +583,22 @@ class PaginatedSelectionView(discord.ui.View):
         
         # Pagination
         self.current_page = 0
-        self.total_pages = max(1, math.ceil(len(self.all_options) / self.items_per_page))
         
-        # Create the Select menu
+        # Create the Select menu: it only edits the current page's share of the selection
+        self.multi = max_values > 1
         self.select = discord.ui.Select(
             placeholder=self.placeholder,
-            min_values=self.min_values,
-            max_values=1,  # Limité à 1 pour la pagination
+            min_values=0,
+            max_values=1,
             options=[],
             row=0
         )
         self.select.callback = self._select_callback
         self.add_item(self.select)
 
-        # Pagination buttons (row 1)
-        if self.total_pages > 1:
+        # Pagination buttons (row 1); shown unless the source is known to fit one page
+        self.paginated = self.pages.total_pages != 1
+        if self.paginated:
             self.prev_button = discord.ui.Button(
                 label="◀ Previous",
                 style=discord.ButtonStyle.secondary,
@@ -398,7 +609,7 @@ class PaginatedSelectionView(discord.ui.View):
             self.add_item(self.prev_button)
 
             self.page_button = discord.ui.Button(
-                label=f"Page 1/{self.total_pages}",
+                label="Page 1",
                 style=discord.ButtonStyle.gray,
                 disabled=True,
                 row=1
@@ -408,25 +619,55 @@ class PaginatedSelectionView(discord.ui.View):
             self.next_button = discord.ui.Button(
                 label="Next ▶",
                 style=discord.ButtonStyle.secondary,
-                disabled=self.total_pages <= 1,
                 row=1
             )
             self.next_button.callback = self._next_page_callback
             self.add_item(self.next_button)
 
-        # Back button (row 2)
+        # Selection shortcuts (row 2)
+        button_row = 2
+        if self.multi:
+            self.select_page_button = discord.ui.Button(
+                label="Select page",
+                style=discord.ButtonStyle.secondary,
+                emoji="☑️",
+                row=button_row
+            )
+            self.select_page_button.callback = self._select_page_callback
+            self.add_item(self.select_page_button)
+
+            self.select_all_button = discord.ui.Button(
+                label="Select all",
+                style=discord.ButtonStyle.secondary,
+                emoji="✔️",
+                row=button_row
+            )
+            self.select_all_button.callback = self._select_all_callback
+            self.add_item(self.select_all_button)
+
+            self.clear_button = discord.ui.Button(
+                label="Clear",
+                style=discord.ButtonStyle.secondary,
+                emoji="🧹",
+                row=button_row
+            )
+            self.clear_button.callback = self._clear_callback
+            self.add_item(self.clear_button)
+            button_row += 1
+
+        # Back button
         if self.show_back_button:
             self.back_button = discord.ui.Button(
                 label="← Previous",
                 style=discord.ButtonStyle.secondary,
                 emoji="⬅️",
-                row=2
+                row=button_row
             )
             self.back_button.callback = self._back_callback
             self.add_item(self.back_button)
+            button_row += 1
 
-        # Confirmation buttons (row 2 or 3)
-        button_row = 3 if self.show_back_button else 2
+        # Confirmation buttons
         if not self.auto_confirm:
             self.confirm_button = discord.ui.Button(
                 label="Confirm",
@@ -447,14 +688,53 @@ class PaginatedSelectionView(discord.ui.View):
             self.cancel_button.callback = self._cancel_callback
             self.add_item(self.cancel_button)
 
-        # Update initial options
+        # Update initial options (async sources wait for load())
+        if not self.pages.is_async:
+            self.update_select_options()
+
+    @property
+    def total_pages(self) -> Optional[int]:
+        return self.pages.total_pages
+
+    @property
+    def selected_values(self) -> List[str]:
+        return list(self.selected)
+
+    def _option_value(self, page: int, i: int, option: Any) -> str:
+        # Plain options are identified by their position in the whole list
+        fallback = str(page * self.items_per_page + i)
+        return option.get('value', fallback) if isinstance(option, dict) else fallback
+
+    def _page_values(self, page: int) -> List[str]:
+        return [self._option_value(page, i, option) for i, option in enumerate(self.pages.get(page))]
+
+    def _add(self, values: List[str]) -> int:
+        """Select ``values`` in order, as far as ``max_values`` allows; returns how many did not fit"""
+        missed = 0
+        for value in values:
+            if value in self.selected:
+                continue
+            if len(self.selected) >= self.max_values:
+                missed += 1
+            else:
+                self.selected[value] = None
+        return missed
+
+    async def _limit_notice(self, interaction: discord.Interaction, missed: int):
+        if missed:
+            await interaction.followup.send(
+                f"⚠️ Selection limit reached ({self.max_values} max): {missed} option(s) not added.", ephemeral=True
+            )
+
+    async def load(self, page: int = 0):
+        """Build ``page`` (from any source) and show it"""
+        await self.pages.load(page)
+        self.current_page = page
         self.update_select_options()
 
     def get_current_page_options(self) -> List[Dict[str, Any]]:
         """Get options for the current page"""
-        start_idx = self.current_page * self.items_per_page
-        end_idx = start_idx + self.items_per_page
-        return self.all_options[start_idx:end_idx]
+        return self.pages.get(self.current_page)
 
     def update_select_options(self):
         """Update dropdown options for current page"""
@@ -462,9 +742,14 @@ class PaginatedSelectionView(discord.ui.View):
         
         current_options = self.get_current_page_options()
         
+        # Discord refuses a select without options (e.g. an empty lazy source)
+        self.select.disabled = not current_options
+        if not current_options:
+            self.select.append_option(discord.SelectOption(label="No options", value="__none__"))
+        
         for i, option in enumerate(current_options):
-            value = option.get('value', str(i)) if isinstance(option, dict) else str(i)
-            is_selected = value in self.selected_values
+            value = self._option_value(self.current_page, i, option)
+            is_selected = value in self.selected
 
             if isinstance(option, dict):
                 self.select.append_option(discord.SelectOption(
@@ -481,36 +766,97 @@ class PaginatedSelectionView(discord.ui.View):
                     default=is_selected
                 ))
 
+        count = len(self.selected)
+        self.select.placeholder = f"{self.placeholder} ({count} selected)"[:150] if count else self.placeholder
+        if self.multi:
+            # This page's picks are resubmitted with the menu, so they count toward its capacity
+            on_page = sum(self._option_value(self.current_page, i, option) in self.selected
+                          for i, option in enumerate(current_options))
+            capacity = min(len(current_options), on_page + self.max_values - count)
+            self.select.max_values = max(1, capacity)
+            if current_options and capacity == 0:
+                self.select.disabled = True
+                self.select.placeholder = f"Limit reached: {count}/{self.max_values} selected (clear some to pick others)"[:150]
+        else:
+            self.select.max_values = 1
+        if not self.auto_confirm:
+            self.confirm_button.disabled = count < max(1, self.min_values)
+
         # Update pagination buttons if they exist
-        if self.total_pages > 1:
+        if self.paginated:
             self.prev_button.disabled = self.current_page == 0
-            self.next_button.disabled = self.current_page >= self.total_pages - 1
-            self.page_button.label = f"Page {self.current_page + 1}/{self.total_pages}"
+            self.next_button.disabled = not self.pages.has_page(self.current_page + 1)
+            self.page_button.label = f"Page {self.current_page + 1}/{self.total_pages or '?'}"
 
     async def _select_callback(self, interaction: discord.Interaction):
         if interaction.user != self.author:
             await interaction.response.send_message("❌ Only the author can select.", ephemeral=True)
             return
 
-        selected_value = interaction.data['values'][0]
-        
-        if selected_value in self.selected_values:
-            self.selected_values.remove(selected_value)
+        # The menu reports this page's full selection: drop what was unticked, add the rest
+        submitted = interaction.data['values']
+        if self.multi:
+            for value in self._page_values(self.current_page):
+                if value not in submitted:
+                    self.selected.pop(value, None)
+            missed = self._add(submitted)
         else:
-            if len(self.selected_values) >= self.max_values:
-                self.selected_values = [selected_value]
-            else:
-                self.selected_values.append(selected_value)
+            self.selected = dict.fromkeys(submitted[:1])
+            missed = 0
         
-        if self.auto_confirm and self.selected_values:
+        if self.auto_confirm and self.selected:
             self.confirmed = True
             await interaction.response.defer()
             self.stop()
         else:
-            if not self.auto_confirm:
-                self.confirm_button.disabled = len(self.selected_values) == 0
             self.update_select_options()
             await interaction.response.edit_message(view=self)
+            await self._limit_notice(interaction, missed)
+
+    async def _select_page_callback(self, interaction: discord.Interaction):
+        if interaction.user != self.author:
+            await interaction.response.send_message("❌ Only the author can select.", ephemeral=True)
+            return
+        
+        # Toggle: a fully selected page is unselected
+        values = self._page_values(self.current_page)
+        if values and all(value in self.selected for value in values):
+            for value in values:
+                self.selected.pop(value, None)
+            missed = 0
+        else:
+            missed = self._add(values)
+        self.update_select_options()
+        await interaction.response.edit_message(view=self)
+        await self._limit_notice(interaction, missed)
+
+    async def _select_all_callback(self, interaction: discord.Interaction):
+        if interaction.user != self.author:
+            await interaction.response.send_message("❌ Only the author can select.", ephemeral=True)
+            return
+        
+        # Builds every page not shown yet, in order, until the list or max_values is reached
+        page = 0
+        missed = 0
+        while self.pages.has_page(page) and not missed:
+            await self.pages.load(page)
+            missed = self._add(self._page_values(page))
+            page += 1
+        self.update_select_options()
+        await interaction.response.edit_message(view=self)
+        if missed:
+            await interaction.followup.send(
+                f"⚠️ Selection limit reached: the first {self.max_values} options are selected.", ephemeral=True
+            )
+
+    async def _clear_callback(self, interaction: discord.Interaction):
+        if interaction.user != self.author:
+            await interaction.response.send_message("❌ Only the author can select.", ephemeral=True)
+            return
+        
+        self.selected.clear()
+        self.update_select_options()
+        await interaction.response.edit_message(view=self)
 
     async def _prev_page_callback(self, interaction: discord.Interaction):
         if interaction.user != self.author:
@@ -518,8 +864,7 @@ class PaginatedSelectionView(discord.ui.View):
             return
         
         if self.current_page > 0:
-            self.current_page -= 1
-            self.update_select_options()
+            await self.load(self.current_page - 1)
             await interaction.response.edit_message(view=self)
         else:
             await interaction.response.defer()
@@ -529,9 +874,8 @@ class PaginatedSelectionView(discord.ui.View):
             await interaction.response.send_message("❌ Only the author can navigate.", ephemeral=True)
             return
         
-        if self.current_page < self.total_pages - 1:
-            self.current_page += 1
-            self.update_select_options()
+        if self.pages.has_page(self.current_page + 1):
+            await self.load(self.current_page + 1)
             await interaction.response.edit_message(view=self)
         else:
             await interaction.response.defer()
@@ -564,17 +908,21 @@ class PaginatedSelectionView(discord.ui.View):
 
     def get_selected_option_labels(self) -> List[str]:
         """Get the labels of selected options for display purposes"""
+        # Selections can only come from pages already shown
         selected_labels = []
-        for option in self.all_options:
-            if isinstance(option, dict):
-                if option.get('value') in self.selected_values:
-                    selected_labels.append(option.get('label', 'Unknown'))
-            elif str(self.all_options.index(option)) in self.selected_values:
-                selected_labels.append(str(option))
+        for page, options in sorted(self.pages.pages.items()):
+            for i, option in enumerate(options):
+                if self._option_value(page, i, option) in self.selected:
+                    selected_labels.append(option.get('label', 'Unknown') if isinstance(option, dict) else str(option))
         return selected_labels
 
 class SearchableSelectionView(discord.ui.View):
-    """Selection view with text-based search for very large lists"""
+    """
+    Selection view with text-based search for very large lists.
+
+    Options are indexed once (``SearchIndex``); each search returns the best
+    ``max_results`` matches, ranked, instead of scanning every option.
+    """
 
     def __init__(self,
                  author: discord.Member,
@@ -585,7 +933,10 @@ class SearchableSelectionView(discord.ui.View):
         super().__init__(timeout=timeout)
         self.author = author
         self.all_options = options
-        self.filtered_options = options[:20]  # Show first 20 initially
+        self.max_results = 20
+        self.search_index = SearchIndex(options)
+        self.filtered_options = options[:self.max_results]  # Show first 20 initially
+        self.match_count = len(options)
         self.selected_values = []
         self.confirmed: Optional[bool] = None
         self.auto_confirm = auto_confirm
@@ -653,7 +1004,7 @@ class SearchableSelectionView(discord.ui.View):
 
         # Update search button label
         if self.search_query:
-            self.search_button.label = f"🔍 Search: '{self.search_query}' ({len(self.filtered_options)} found)"
+            self.search_button.label = f"🔍 Search: '{self.search_query}'"[:70] + f" ({self.match_count} found)"
         else:
             self.search_button.label = f"🔍 Search Categories ({len(self.filtered_options)}/{len(self.all_options)} shown)"
 
@@ -699,25 +1050,9 @@ class SearchableSelectionView(discord.ui.View):
         self.stop()
 
     def filter_options(self, query: str):
-        """Filter options based on search query"""
-        if not query:
-            self.filtered_options = self.all_options[:20]
-            self.search_query = ""
-        else:
-            query_lower = query.lower()
-            filtered = []
-            for option in self.all_options:
-                if isinstance(option, dict):
-                    label = option.get('label', '').lower()
-                    description = option.get('description', '').lower()
-                    if query_lower in label or query_lower in description:
-                        filtered.append(option)
-                else:
-                    if query_lower in str(option).lower():
-                        filtered.append(option)
-            
-            self.filtered_options = filtered[:20]  # Limit to 20 results
-            self.search_query = query
+        """Show the best-ranked options for the search query (prefix, accent and typo tolerant)"""
+        self.filtered_options, self.match_count = self.search_index.search(query, limit=self.max_results)
+        self.search_query = query
 
 class SearchModal(discord.ui.Modal, title="Search Categories"):
     def __init__(self, parent_view):
@@ -747,10 +1082,11 @@ class SearchModal(discord.ui.Modal, title="Search Categories"):
 class ServerInfoView(discord.ui.View):
     """Interactive view for server info with additional details"""
     
-    def __init__(self, author: discord.Member, guild: discord.Guild):
+    def __init__(self, author: discord.Member, guild: discord.Guild, stats: Optional[Any] = None):
         super().__init__(timeout=300.0)
         self.author = author
         self.guild = guild
+        self.stats = stats  # guild_index.GuildStats, counters kept current by events
     
     @discord.ui.button(label="🎭 View Roles", style=discord.ButtonStyle.secondary, emoji="🎭")
     async def view_roles(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -779,7 +1115,10 @@ class ServerInfoView(discord.ui.View):
                 
                 role_list = []
                 for role in reversed(chunk):  # Show highest roles first
-                    member_count = len(role.members)
+                    if self.stats is not None:
+                        member_count = self.stats.role_count(role, self.guild.member_count)
+                    else:
+                        member_count = len(role.members)
                     role_list.append(f"{role.mention} - `{member_count}` members")
                 
                 embed.description = "\n".join(role_list)
@@ -806,7 +1145,10 @@ class ServerInfoView(discord.ui.View):
         
         # Member join dates analysis
         now = datetime.now(timezone.utc)
-        recent_joins = len([m for m in self.guild.members if m.joined_at and (now - m.joined_at).days <= 7])
+        if self.stats is not None:
+            recent_joins = self.stats.recent_joins(7)
+        else:
+            recent_joins = len([m for m in self.guild.members if m.joined_at and (now - m.joined_at).days <= 7])
 
         embed.add_field(
             name="📈 Recent Activity",
@@ -840,11 +1182,22 @@ class ServerInfoView(discord.ui.View):
 class WeatherView(discord.ui.View):
     """Interactive view for weather information"""
     
-    def __init__(self, author: discord.Member, city: str, weather_data: dict):
+    def __init__(self,
+                 author: discord.Member,
+                 city: str,
+                 weather_data: dict,
+                 fetch_weather: Callable,
+                 build_embed: Callable,
+                 refresh_debounce: float = 10.0):
         super().__init__(timeout=300.0)
         self.author = author
         self.city = city
         self.weather_data = weather_data
+        self.fetch_weather = fetch_weather  # async (city) -> payload, cache-aware
+        self.build_embed = build_embed      # (payload, city, author) -> discord.Embed
+        self.refresh_debounce = refresh_debounce
+        self.last_refresh = 0.0
+        self._refreshing = False
     
     @discord.ui.button(label="🔄 Refresh", style=discord.ButtonStyle.green, emoji="🔄")
     async def refresh_weather(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -852,8 +1205,36 @@ class WeatherView(discord.ui.View):
             await interaction.response.send_message("❌ Only the author can refresh.", ephemeral=True)
             return
         
+        # Debounce: ignore clicks while a refresh runs or shortly after one
+        now = asyncio.get_running_loop().time()
+        wait = self.refresh_debounce - (now - self.last_refresh)
+        if self._refreshing or wait > 0:
+            await interaction.response.send_message(
+                f"⏳ Already refreshed, try again in {max(wait, 0):.0f}s.", ephemeral=True
+            )
+            return
+        self._refreshing = True
+        self.last_refresh = now
+        
         await interaction.response.defer()
-        # You could refresh the weather data here
+        try:
+            data = await self.fetch_weather(self.city)
+            if data.get('cod') != 200:
+                await interaction.followup.send(
+                    f"❌ Could not refresh weather: {data.get('message', 'Unknown error')}", ephemeral=True
+                )
+                return
+            
+            self.weather_data = data
+            await interaction.edit_original_response(
+                embed=self.build_embed(data, self.city, self.author), view=self
+            )
+            logging.info(f"Weather refreshed for {self.city} by {interaction.user}")
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            await interaction.followup.send("❌ Unable to reach the weather service. Please try again later.", ephemeral=True)
+            logging.error(f"Weather refresh error for {self.city}: {e}")
+        finally:
+            self._refreshing = False
     
     @discord.ui.button(label="📍 Location Info", style=discord.ButtonStyle.secondary, emoji="📍")
     async def location_info(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -881,25 +1262,3 @@ class WeatherView(discord.ui.View):
         )
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    def __init__(self):
-        super().__init__(timeout=30.0)
-        self.confirmed = None
-
-    @discord.ui.button(label="Appliquer les permissions", style=discord.ButtonStyle.green, emoji="🔧")
-    async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user != ctx.author:
-            await interaction.response.send_message("❌ Seul l'auteur peut confirmer.", ephemeral=True)
-            return
-        self.confirmed = True
-        await interaction.response.defer()
-        self.stop()
-
-    @discord.ui.button(label="Annuler", style=discord.ButtonStyle.red, emoji="❌")
-    async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user != ctx.author:
-            await interaction.response.send_message("❌ Seul l'auteur peut annuler.", ephemeral=True)
-            return
-        self.confirmed = False
-        await interaction.response.defer()
-        self.stop()
\ No newline at end of file
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Set, Tuple
+
+import aiohttp
+
+# ========================
+# WEATHER CACHE
+# ========================
+
+def normalize_city(city: str) -> str:
+    """Case-fold, strip accents and collapse spacing so equivalent queries share a key"""
+    folded = unicodedata.normalize("NFKD", city.casefold())
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    parts = [" ".join(part.split()) for part in folded.split(",")]
+    return ",".join(part for part in parts if part)
+
+class WeatherCache:
+    """Size- and TTL-bounded LRU cache of weather payloads with alias keys"""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # canonical key -> (stored_at, payload), oldest first
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # normalized query -> canonical key, and the reverse for eviction
+        self._aliases: Dict[str, str] = {}
+        self._aliases_by_key: Dict[str, Set[str]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def canonical_key(payload: Dict[str, Any]) -> Optional[str]:
+        """Key a payload by OpenWeatherMap city id, falling back to rounded coords"""
+        if payload.get('id'):
+            return f"id:{payload['id']}"
+        coord = payload.get('coord') or {}
+        if 'lat' in coord and 'lon' in coord:
+            return f"coord:{round(coord['lat'], 2)},{round(coord['lon'], 2)}"
+        return None
+
+    def get(self, city: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached payload for a city, or None on miss/expiry"""
+        key = self._aliases.get(normalize_city(city))
+        entry = self._entries.get(key) if key else None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, payload = entry
+        if time.monotonic() - stored_at > self.ttl:
+            self._drop(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def put(self, city: str, payload: Dict[str, Any]):
+        """Store a successful payload under its canonical key and the query alias"""
+        key = self.canonical_key(payload) or f"query:{normalize_city(city)}"
+        alias = normalize_city(city)
+
+        previous = self._aliases.get(alias)
+        if previous and previous != key:
+            self._aliases_by_key.get(previous, set()).discard(alias)
+
+        self._entries[key] = (time.monotonic(), payload)
+        self._entries.move_to_end(key)
+        self._aliases[alias] = key
+        self._aliases_by_key.setdefault(key, set()).add(alias)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, key: str):
+        self._entries.pop(key, None)
+        for alias in self._aliases_by_key.pop(key, set()):
+            if self._aliases.get(alias) == key:
+                del self._aliases[alias]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'aliases': len(self._aliases),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+# ========================
+# OPENWEATHERMAP CLIENT
+# ========================
+
+OPENWEATHER_URL = "http://api.openweathermap.org/data/2.5/weather"
+
+class WeatherClient:
+    """Asyncio-native OpenWeatherMap client backed by one pooled aiohttp session"""
+
+    def __init__(self,
+                 api_key: Optional[str],
+                 base_url: str = OPENWEATHER_URL,
+                 timeout: float = 10.0,
+                 pool_size: int = 20,
+                 cache: Optional[WeatherCache] = None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.pool_size = pool_size
+        self.cache = cache if cache is not None else WeatherCache()
+        self.session: Optional[aiohttp.ClientSession] = None
+        # normalized city -> the one fetch currently in flight for it
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.upstream_calls = 0
+        self.coalesced = 0
+
+    async def start(self):
+        """Open the shared session (called from the bot's setup hook)"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            logging.info(f"🌐 Weather client session opened (pool size: {self.pool_size})")
+
+    async def close(self):
+        """Close the shared session on shutdown"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+            logging.info("🌐 Weather client session closed")
+        self.session = None
+
+    async def get_weather(self, city: str) -> Dict[str, Any]:
+        """
+        Return current weather for a city, served from cache while fresh.
+
+        Concurrent misses for the same normalized city share a single upstream
+        request; every waiter receives the same parsed payload (or exception).
+        """
+        cached = self.cache.get(city)
+        if cached is not None:
+            return cached
+
+        key = normalize_city(city)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(city))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        # Shield so one cancelled waiter does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, city: str) -> Dict[str, Any]:
+        data = await self.fetch_current(city)
+        if data.get('cod') == 200:
+            self.cache.put(city, data)
+        return data
+
+    async def fetch_current(self, city: str) -> Dict[str, Any]:
+        """
+        Fetch the current weather payload for a city, bypassing the cache.
+
+        The raw OpenWeatherMap JSON is returned as-is, including error payloads
+        (``cod`` != 200), so callers keep their own error table. Network errors
+        surface as ``asyncio.TimeoutError`` or ``aiohttp.ClientError``.
+        """
+        if self.session is None or self.session.closed:
+            await self.start()
+
+        params = {"q": city, "appid": self.api_key, "units": "metric"}
+        self.upstream_calls += 1
+        async with self.session.get(self.base_url, params=params) as response:
+            return await response.json(content_type=None)